@@ -3,7 +3,10 @@ from __future__ import annotations
 import hashlib
 import json
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from json.encoder import encode_basestring
 from pathlib import Path
 from typing import Any
 
@@ -13,7 +16,6 @@ from factpy_kernel.mapping.canon import MappingConflictError
 from factpy_kernel.policy.policy_ir import (
     build_policy_ir_v1,
     canonicalize_policy_ir_jcs,
-    policy_digest,
 )
 from factpy_kernel.protocol.digests import sha256_token
 from factpy_kernel.protocol.tup_v1 import canonical_bytes_tup_v1
@@ -21,11 +23,26 @@ from factpy_kernel.rules.where_compile import (
     compile_where_to_query_dl,
     query_rel_for_where,
 )
-from factpy_kernel.schema.schema_ir import canonicalize_schema_ir_jcs, schema_digest
+from factpy_kernel.schema.schema_ir import canonicalize_schema_ir_jcs
 from factpy_kernel.store.api import Store
 from factpy_kernel.view.souffle_view_gen import generate_view_dl
 
 
+_FACT_WRITE_WORKERS = 4
+
+_MATERIALIZE_META_STR_KEYS = (
+    "run_id",
+    "derived_rule_id",
+    "derived_rule_version",
+    "key_tuple_digest",
+    "cand_key_digest",
+    "support_digest",
+    "support_kind",
+    "approved_by",
+    "note",
+)
+
+
 @dataclass(frozen=True)
 class ExportOptions:
     package_kind: str = "inference"
@@ -93,7 +110,7 @@ def export_package(
     )
     (rules_dir / "view.dl").write_text(view_dl, encoding="utf-8", newline="\n")
 
-    outputs_map = _outputs_map(store)
+    outputs_map, entrypoints = _scan_predicates(store)
     idb_text = ""
     if query is not None:
         if not isinstance(query, dict):
@@ -121,7 +138,10 @@ def export_package(
 
     audit_files: dict[str, str] = {}
     if options.package_kind == "audit":
-        run_ledger_rows, candidate_ledger_rows, materialize_ledger_rows = _build_audit_ledgers(store)
+        meta_index = _build_meta_index(store)
+        run_ledger_rows, candidate_ledger_rows, materialize_ledger_rows = _build_audit_ledgers(
+            store, meta_index
+        )
         run_ledger_path = audit_dir / "run_ledger.jsonl"
         candidate_ledger_path = audit_dir / "candidate_ledger.jsonl"
         materialize_ledger_path = audit_dir / "materialize_ledger.jsonl"
@@ -143,10 +163,10 @@ def export_package(
             encoding="utf-8",
             newline="\n",
         )
-        accept_failed_rows = _build_accept_failed_rows(store, mapping_audit)
+        accept_failed_rows = _build_accept_failed_rows(meta_index, mapping_audit)
         _write_jsonl(accept_failed_path, accept_failed_rows)
         decision_rows = _build_decision_log_rows(
-            store=store,
+            meta_index=meta_index,
             materialize_rows=materialize_ledger_rows,
             mapping_audit=mapping_audit,
         )
@@ -170,16 +190,24 @@ def export_package(
     meta_bool_path = facts_dir / "meta_bool.facts"
     revokes_path = facts_dir / "revokes.facts"
 
-    write_tsv(claim_path, claim_rows)
-    write_tsv(claim_arg_path, claim_arg_rows)
-    write_tsv(meta_str_path, meta_str_rows)
-    write_tsv(meta_time_path, meta_time_rows)
-    write_tsv(meta_num_path, meta_num_rows)
-    write_tsv(meta_bool_path, meta_bool_rows)
-    write_tsv(revokes_path, revokes_rows)
+    fact_writes = [
+        (claim_path, claim_rows),
+        (claim_arg_path, claim_arg_rows),
+        (meta_str_path, meta_str_rows),
+        (meta_time_path, meta_time_rows),
+        (meta_num_path, meta_num_rows),
+        (meta_bool_path, meta_bool_rows),
+        (revokes_path, revokes_rows),
+    ]
+    with ThreadPoolExecutor(max_workers=_FACT_WRITE_WORKERS) as executor:
+        futures = [executor.submit(write_tsv, path, rows) for path, rows in fact_writes]
+        for future in futures:
+            future.result()
 
-    schema_digest_token = schema_digest(store.schema_ir)
-    policy_digest_token = policy_digest(policy_ir)
+    # schema_digest is sha256 over these same canonical bytes; reuse them
+    # rather than validating and serializing the schema a second time.
+    schema_digest_token = sha256_token(schema_bytes)
+    policy_digest_token = sha256_token(policy_ir_bytes)
 
     edb_files = [
         claim_path,
@@ -226,7 +254,7 @@ def export_package(
             "audit": "audit" if options.package_kind == "audit" else None,
             "audit_files": audit_files if options.package_kind == "audit" else None,
         },
-        "entrypoints": _entrypoints(store),
+        "entrypoints": entrypoints,
         "outputs_map": outputs_map,
     }
 
@@ -243,56 +271,58 @@ def export_package(
 def _build_fact_rows(
     store: Store,
 ) -> tuple[
-    list[list[str]],
-    list[list[str]],
-    list[list[str]],
-    list[list[str]],
-    list[list[str]],
-    list[list[str]],
-    list[list[str]],
+    list[tuple[str, ...]],
+    list[tuple[str, ...]],
+    list[tuple[str, ...]],
+    list[tuple[str, ...]],
+    list[tuple[str, ...]],
+    list[tuple[str, ...]],
+    list[tuple[str, ...]],
 ]:
-    claim_rows: list[list[str]] = []
+    claim_rows: list[tuple[str, ...]] = []
     for claim in store.ledger.claims:
         tup_digest = sha256_token(canonical_bytes_tup_v1(claim.rest_terms))
-        claim_rows.append([claim.asrt_id, claim.pred_id, claim.e_ref, tup_digest])
+        claim_rows.append((claim.asrt_id, claim.pred_id, claim.e_ref, tup_digest))
 
-    claim_arg_rows = [
-        [row.asrt_id, str(row.idx), _atom_to_str(row.val_atom), row.tag]
+    claim_arg_rows: list[tuple[str, ...]] = [
+        (row.asrt_id, str(row.idx), _atom_to_str(row.val_atom), row.tag)
         for row in store.ledger.claim_args
     ]
 
-    meta_str_rows = [
-        [row.asrt_id, row.key, _atom_to_str(row.value)]
-        for row in store.ledger.meta_rows
-        if row.kind == "str"
-    ]
-    meta_time_rows = [
-        [row.asrt_id, row.key, _atom_to_str(row.value)]
-        for row in store.ledger.meta_rows
-        if row.kind == "time"
-    ]
-    meta_num_rows = [
-        [row.asrt_id, row.key, _atom_to_str(row.value)]
-        for row in store.ledger.meta_rows
-        if row.kind == "num"
-    ]
-    meta_bool_rows = [
-        [row.asrt_id, row.key, _atom_to_str(row.value)]
-        for row in store.ledger.meta_rows
-        if row.kind == "bool"
-    ]
-    revokes_rows = [
-        [row.revoker_asrt_id, row.revoked_asrt_id] for row in store.ledger.revokes
+    meta_str_rows: list[tuple[str, ...]] = []
+    meta_time_rows: list[tuple[str, ...]] = []
+    meta_num_rows: list[tuple[str, ...]] = []
+    meta_bool_rows: list[tuple[str, ...]] = []
+    meta_rows_by_kind = {
+        "str": meta_str_rows,
+        "time": meta_time_rows,
+        "num": meta_num_rows,
+        "bool": meta_bool_rows,
+    }
+    for row in store.ledger.meta_rows:
+        bucket = meta_rows_by_kind.get(row.kind)
+        if bucket is not None:
+            bucket.append((row.asrt_id, row.key, _atom_to_str(row.value)))
+
+    revokes_rows: list[tuple[str, ...]] = [
+        (row.revoker_asrt_id, row.revoked_asrt_id) for row in store.ledger.revokes
     ]
 
+    claim_rows.sort()
+    claim_arg_rows.sort()
+    meta_str_rows.sort()
+    meta_time_rows.sort()
+    meta_num_rows.sort()
+    meta_bool_rows.sort()
+    revokes_rows.sort()
     return (
-        sorted(claim_rows),
-        sorted(claim_arg_rows),
-        sorted(meta_str_rows),
-        sorted(meta_time_rows),
-        sorted(meta_num_rows),
-        sorted(meta_bool_rows),
-        sorted(revokes_rows),
+        claim_rows,
+        claim_arg_rows,
+        meta_str_rows,
+        meta_time_rows,
+        meta_num_rows,
+        meta_bool_rows,
+        revokes_rows,
     )
 
 
@@ -333,26 +363,12 @@ def _protocol_version(schema_ir: dict) -> dict[str, str]:
     return base
 
 
-def _entrypoints(store: Store) -> list[str]:
+def _scan_predicates(store: Store) -> tuple[dict[str, list[str]], list[str]]:
     predicates = store.schema_ir.get("predicates") if isinstance(store.schema_ir, dict) else None
     if not isinstance(predicates, list):
-        return []
-    out: list[str] = []
-    for pred in predicates:
-        if not isinstance(pred, dict):
-            continue
-        pred_id = pred.get("pred_id")
-        if isinstance(pred_id, str) and pred_id:
-            out.append(pred_id)
-    return sorted(set(out))
-
-
-def _outputs_map(store: Store) -> dict[str, list[str]]:
-    predicates = store.schema_ir.get("predicates") if isinstance(store.schema_ir, dict) else None
-    if not isinstance(predicates, list):
-        return {}
+        return {}, []
 
-    out: dict[str, list[str]] = {}
+    outputs_map: dict[str, list[str]] = {}
     for pred in predicates:
         if not isinstance(pred, dict):
             continue
@@ -360,19 +376,18 @@ def _outputs_map(store: Store) -> dict[str, list[str]]:
         if not isinstance(pred_id, str) or not pred_id:
             continue
         engine_pred = normalize_pred_id(pred_id)
-        cardinality = pred.get("cardinality")
-        if cardinality == "temporal":
-            out[pred_id] = [engine_pred, f"{engine_pred}__current"]
+        if pred.get("cardinality") == "temporal":
+            outputs_map[pred_id] = [engine_pred, f"{engine_pred}__current"]
         else:
-            out[pred_id] = [engine_pred]
-    return out
+            outputs_map[pred_id] = [engine_pred]
+    return outputs_map, sorted(outputs_map)
 
 
 def _latest_run_id(store: Store) -> str | None:
-    run_rows = [row for row in store.ledger.meta_rows if row.key == "run_id" and row.kind == "str"]
-    if not run_rows:
-        return None
-    return str(run_rows[-1].value)
+    for row in reversed(store.ledger.meta_rows):
+        if row.key == "run_id" and row.kind == "str":
+            return str(row.value)
+    return None
 
 
 def _build_mapping_audit_payload(store: Store, policy_mode: str) -> dict[str, Any]:
@@ -455,9 +470,10 @@ def _write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
 
 def _build_audit_ledgers(
     store: Store,
+    meta_index: dict[str, dict[tuple[str, str], Any]],
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
-    run_rows = _build_run_ledger_rows(store)
-    materialize_rows = _build_materialize_ledger_rows(store)
+    run_rows = _build_run_ledger_rows(store, meta_index)
+    materialize_rows = _build_materialize_ledger_rows(store, meta_index)
     candidate_rows = _build_candidate_ledger_rows(materialize_rows)
     return run_rows, candidate_rows, materialize_rows
 
@@ -507,7 +523,10 @@ def _build_candidate_ledger_rows(materialize_rows: list[dict[str, Any]]) -> list
     )
 
 
-def _build_accept_failed_rows(store: Store, mapping_audit: dict[str, Any]) -> list[dict[str, Any]]:
+def _build_accept_failed_rows(
+    meta_index: dict[str, dict[tuple[str, str], Any]],
+    mapping_audit: dict[str, Any],
+) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
     predicates = mapping_audit.get("predicates")
     policy_mode = mapping_audit.get("policy_mode")
@@ -529,10 +548,10 @@ def _build_accept_failed_rows(store: Store, mapping_audit: dict[str, Any]) -> li
                         continue
                     candidate_asrt_ids = conflict.get("candidate_asrt_ids")
                     run_ids, materialize_ids = _collect_run_materialize_ids(
-                        store,
+                        meta_index,
                         candidate_asrt_ids,
                     )
-                    event_ts = _collect_event_ts(store, candidate_asrt_ids)
+                    event_ts = _collect_event_ts(meta_index, candidate_asrt_ids)
                     decision_id = _mapping_conflict_decision_id(
                         pred_id=pred_id,
                         key_tuple=conflict.get("key_tuple"),
@@ -583,7 +602,7 @@ def _build_accept_failed_rows(store: Store, mapping_audit: dict[str, Any]) -> li
 
 def _build_decision_log_rows(
     *,
-    store: Store,
+    meta_index: dict[str, dict[tuple[str, str], Any]],
     materialize_rows: list[dict[str, Any]],
     mapping_audit: dict[str, Any],
 ) -> list[dict[str, Any]]:
@@ -636,10 +655,10 @@ def _build_decision_log_rows(
                             continue
                         candidate_asrt_ids = decision.get("candidate_asrt_ids")
                         run_ids, materialize_ids = _collect_run_materialize_ids(
-                            store,
+                            meta_index,
                             candidate_asrt_ids,
                         )
-                        event_ts = _collect_event_ts(store, candidate_asrt_ids)
+                        event_ts = _collect_event_ts(meta_index, candidate_asrt_ids)
                         decision_id = _mapping_decision_id(
                             pred_id=pred_id,
                             key_tuple=decision.get("key_tuple"),
@@ -670,10 +689,10 @@ def _build_decision_log_rows(
                             continue
                         candidate_asrt_ids = conflict.get("candidate_asrt_ids")
                         run_ids, materialize_ids = _collect_run_materialize_ids(
-                            store,
+                            meta_index,
                             candidate_asrt_ids,
                         )
-                        event_ts = _collect_event_ts(store, candidate_asrt_ids)
+                        event_ts = _collect_event_ts(meta_index, candidate_asrt_ids)
                         decision_id = _mapping_conflict_decision_id(
                             pred_id=pred_id,
                             key_tuple=conflict.get("key_tuple"),
@@ -723,10 +742,13 @@ def _build_decision_log_rows(
     )
 
 
-def _build_run_ledger_rows(store: Store) -> list[dict[str, Any]]:
+def _build_run_ledger_rows(
+    store: Store,
+    meta_index: dict[str, dict[tuple[str, str], Any]],
+) -> list[dict[str, Any]]:
     run_map: dict[str, dict[str, Any]] = {}
     for claim in sorted(store.ledger.claims, key=lambda row: row.asrt_id):
-        run_id = _meta_str(store, claim.asrt_id, "run_id")
+        run_id = _meta_str(meta_index, claim.asrt_id, "run_id")
         if run_id is None:
             continue
         entry = run_map.get(run_id)
@@ -740,7 +762,7 @@ def _build_run_ledger_rows(store: Store) -> list[dict[str, Any]]:
             run_map[run_id] = entry
         entry["claim_count"] += 1
         entry["pred_ids"].add(claim.pred_id)
-        materialize_id = _meta_str(store, claim.asrt_id, "materialize_id")
+        materialize_id = _meta_str(meta_index, claim.asrt_id, "materialize_id")
         if materialize_id:
             entry["materialize_ids"].add(materialize_id)
 
@@ -764,102 +786,50 @@ def _attach_decision_ids_to_run_ledger(
     accept_failed_rows: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
     run_to_decision_ids: dict[str, set[str]] = {}
-    run_to_event_ts_values: dict[str, list[int]] = {}
-    run_to_source_counts: dict[str, dict[str, int]] = {}
-    run_to_kind_counts: dict[str, dict[str, int]] = {}
-    run_to_error_count: dict[str, int] = {}
-    run_to_error_class_counts: dict[str, dict[str, int]] = {}
-    run_to_error_event_kind_counts: dict[str, dict[str, int]] = {}
-    run_to_error_ts_values: dict[str, list[int]] = {}
+    run_to_event_ts_minmax: dict[str, tuple[int, int]] = {}
+    run_to_source_counts: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+    run_to_kind_counts: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+    run_to_error_count: defaultdict[str, int] = defaultdict(int)
+    run_to_error_class_counts: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+    run_to_error_event_kind_counts: defaultdict[str, defaultdict[str, int]] = defaultdict(
+        lambda: defaultdict(int)
+    )
+    run_to_error_ts_minmax: dict[str, tuple[int, int]] = {}
     run_to_failed_decision_ids: dict[str, set[str]] = {}
     run_to_latest_failure: dict[str, tuple[tuple[int, int, str], str | None, str | None, str | None]] = {}
-    for row in decision_rows:
-        if not isinstance(row, dict):
-            continue
-        decision_id = row.get("decision_id")
-        if not isinstance(decision_id, str) or not decision_id:
-            continue
-        event_source = row.get("event_source")
-        source_value = event_source if isinstance(event_source, str) and event_source else None
-        event_kind = row.get("event_kind")
-        kind_value = event_kind if isinstance(event_kind, str) and event_kind else None
-        event_ts = row.get("event_ts")
-        event_ts_value = event_ts if isinstance(event_ts, int) and not isinstance(event_ts, bool) else None
-        target_runs: set[str] = set()
-        run_id = row.get("run_id")
-        if isinstance(run_id, str) and run_id:
-            target_runs.add(run_id)
-        run_ids = row.get("run_ids")
-        if isinstance(run_ids, list):
-            for value in run_ids:
-                if isinstance(value, str) and value:
-                    target_runs.add(value)
-        for target_run in target_runs:
-            run_to_decision_ids.setdefault(target_run, set()).add(decision_id)
-            if source_value is not None:
-                source_counts = run_to_source_counts.setdefault(target_run, {})
-                source_counts[source_value] = source_counts.get(source_value, 0) + 1
-            if kind_value is not None:
-                kind_counts = run_to_kind_counts.setdefault(target_run, {})
-                kind_counts[kind_value] = kind_counts.get(kind_value, 0) + 1
-            if event_ts_value is not None:
-                run_to_event_ts_values.setdefault(target_run, []).append(event_ts_value)
-
-    for row in accept_failed_rows:
-        if not isinstance(row, dict):
-            continue
-        run_ids = row.get("run_ids")
-        if not isinstance(run_ids, list):
-            continue
-        target_runs = sorted(
-            {
-                value
-                for value in run_ids
-                if isinstance(value, str) and value
-            }
+    for event in _decision_events(decision_rows):
+        for target_run in event.target_runs:
+            run_to_decision_ids.setdefault(target_run, set()).add(event.decision_id)
+            if event.event_source is not None:
+                run_to_source_counts[target_run][event.event_source] += 1
+            if event.event_kind is not None:
+                run_to_kind_counts[target_run][event.event_kind] += 1
+            if event.event_ts is not None:
+                _update_ts_minmax(run_to_event_ts_minmax, target_run, event.event_ts)
+
+    for failure in _failure_events(accept_failed_rows):
+        latest_sort_key = (
+            1 if failure.event_ts is not None else 0,
+            failure.event_ts if failure.event_ts is not None else -1,
+            failure.decision_id or "",
         )
-        if not target_runs:
-            continue
-
-        error_class = row.get("error_class")
-        error_class_value = error_class if isinstance(error_class, str) and error_class else None
-        error_event_kind = row.get("event_kind")
-        error_event_kind_value = (
-            error_event_kind if isinstance(error_event_kind, str) and error_event_kind else None
-        )
-        error_event_ts = row.get("event_ts")
-        error_event_ts_value = (
-            error_event_ts if isinstance(error_event_ts, int) and not isinstance(error_event_ts, bool) else None
-        )
-        decision_id = row.get("decision_id")
-        decision_id_value = decision_id if isinstance(decision_id, str) and decision_id else None
-        message = row.get("message")
-        message_value = message if isinstance(message, str) and message else None
-
-        for target_run in target_runs:
-            run_to_error_count[target_run] = run_to_error_count.get(target_run, 0) + 1
-            if error_class_value is not None:
-                class_counts = run_to_error_class_counts.setdefault(target_run, {})
-                class_counts[error_class_value] = class_counts.get(error_class_value, 0) + 1
-            if error_event_kind_value is not None:
-                kind_counts = run_to_error_event_kind_counts.setdefault(target_run, {})
-                kind_counts[error_event_kind_value] = kind_counts.get(error_event_kind_value, 0) + 1
-            if error_event_ts_value is not None:
-                run_to_error_ts_values.setdefault(target_run, []).append(error_event_ts_value)
-            if decision_id_value is not None:
-                run_to_failed_decision_ids.setdefault(target_run, set()).add(decision_id_value)
-            latest_sort_key = (
-                1 if error_event_ts_value is not None else 0,
-                error_event_ts_value if error_event_ts_value is not None else -1,
-                decision_id_value or "",
-            )
+        for target_run in failure.target_runs:
+            run_to_error_count[target_run] += 1
+            if failure.error_class is not None:
+                run_to_error_class_counts[target_run][failure.error_class] += 1
+            if failure.event_kind is not None:
+                run_to_error_event_kind_counts[target_run][failure.event_kind] += 1
+            if failure.event_ts is not None:
+                _update_ts_minmax(run_to_error_ts_minmax, target_run, failure.event_ts)
+            if failure.decision_id is not None:
+                run_to_failed_decision_ids.setdefault(target_run, set()).add(failure.decision_id)
             previous_latest = run_to_latest_failure.get(target_run)
             if previous_latest is None or latest_sort_key > previous_latest[0]:
                 run_to_latest_failure[target_run] = (
                     latest_sort_key,
-                    error_class_value,
-                    decision_id_value,
-                    message_value,
+                    failure.error_class,
+                    failure.decision_id,
+                    failure.message,
                 )
 
     out: list[dict[str, Any]] = []
@@ -867,24 +837,24 @@ def _attach_decision_ids_to_run_ledger(
         run_id = row.get("run_id")
         if isinstance(run_id, str):
             decision_ids = sorted(run_to_decision_ids.get(run_id, set()))
-            event_ts_values = run_to_event_ts_values.get(run_id, [])
+            event_ts_minmax = run_to_event_ts_minmax.get(run_id)
             source_counts = dict(run_to_source_counts.get(run_id, {}))
             kind_counts = dict(run_to_kind_counts.get(run_id, {}))
             error_count = run_to_error_count.get(run_id, 0)
             error_class_counts = dict(run_to_error_class_counts.get(run_id, {}))
             error_event_kind_counts = dict(run_to_error_event_kind_counts.get(run_id, {}))
-            error_ts_values = run_to_error_ts_values.get(run_id, [])
+            error_ts_minmax = run_to_error_ts_minmax.get(run_id)
             failed_decision_ids = sorted(run_to_failed_decision_ids.get(run_id, set()))
             latest_failure = run_to_latest_failure.get(run_id)
         else:
             decision_ids = []
-            event_ts_values = []
+            event_ts_minmax = None
             source_counts = {}
             kind_counts = {}
             error_count = 0
             error_class_counts = {}
             error_event_kind_counts = {}
-            error_ts_values = []
+            error_ts_minmax = None
             failed_decision_ids = []
             latest_failure = None
         next_row = dict(row)
@@ -897,9 +867,9 @@ def _attach_decision_ids_to_run_ledger(
         next_row["error_event_kind_counts"] = error_event_kind_counts
         next_row["failed_decision_ids"] = failed_decision_ids
         next_row["has_failures"] = error_count > 0
-        next_row["last_error_ts"] = max(error_ts_values) if error_ts_values else None
-        next_row["failed_event_ts_min"] = min(error_ts_values) if error_ts_values else None
-        next_row["failed_event_ts_max"] = max(error_ts_values) if error_ts_values else None
+        next_row["last_error_ts"] = error_ts_minmax[1] if error_ts_minmax is not None else None
+        next_row["failed_event_ts_min"] = error_ts_minmax[0] if error_ts_minmax is not None else None
+        next_row["failed_event_ts_max"] = error_ts_minmax[1] if error_ts_minmax is not None else None
         if latest_failure is not None:
             next_row["last_failure_class"] = latest_failure[1]
             next_row["last_failure_decision_id"] = latest_failure[2]
@@ -908,9 +878,9 @@ def _attach_decision_ids_to_run_ledger(
             next_row["last_failure_class"] = None
             next_row["last_failure_decision_id"] = None
             next_row["last_failure_message"] = None
-        if event_ts_values:
-            next_row["event_ts_min"] = min(event_ts_values)
-            next_row["event_ts_max"] = max(event_ts_values)
+        if event_ts_minmax is not None:
+            next_row["event_ts_min"] = event_ts_minmax[0]
+            next_row["event_ts_max"] = event_ts_minmax[1]
         else:
             next_row["event_ts_min"] = None
             next_row["event_ts_max"] = None
@@ -918,10 +888,108 @@ def _attach_decision_ids_to_run_ledger(
     return out
 
 
-def _build_materialize_ledger_rows(store: Store) -> list[dict[str, Any]]:
+@dataclass(frozen=True, slots=True)
+class _DecisionEvent:
+    decision_id: str
+    target_runs: frozenset[str]
+    event_source: str | None
+    event_kind: str | None
+    event_ts: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class _FailureEvent:
+    decision_id: str | None
+    target_runs: frozenset[str]
+    error_class: str | None
+    event_kind: str | None
+    event_ts: int | None
+    message: str | None
+
+
+def _decision_events(decision_rows: list[dict[str, Any]]) -> list[_DecisionEvent]:
+    events: list[_DecisionEvent] = []
+    for row in decision_rows:
+        if not isinstance(row, dict):
+            continue
+        decision_id = _non_empty_str(row.get("decision_id"))
+        if decision_id is None:
+            continue
+        target_runs = set(_non_empty_strs(row.get("run_ids")))
+        run_id = _non_empty_str(row.get("run_id"))
+        if run_id is not None:
+            target_runs.add(run_id)
+        events.append(
+            _DecisionEvent(
+                decision_id=decision_id,
+                target_runs=frozenset(target_runs),
+                event_source=_non_empty_str(row.get("event_source")),
+                event_kind=_non_empty_str(row.get("event_kind")),
+                event_ts=_int_or_none(row.get("event_ts")),
+            )
+        )
+    return events
+
+
+def _failure_events(accept_failed_rows: list[dict[str, Any]]) -> list[_FailureEvent]:
+    events: list[_FailureEvent] = []
+    for row in accept_failed_rows:
+        if not isinstance(row, dict):
+            continue
+        target_runs = frozenset(_non_empty_strs(row.get("run_ids")))
+        if not target_runs:
+            continue
+        events.append(
+            _FailureEvent(
+                decision_id=_non_empty_str(row.get("decision_id")),
+                target_runs=target_runs,
+                error_class=_non_empty_str(row.get("error_class")),
+                event_kind=_non_empty_str(row.get("event_kind")),
+                event_ts=_int_or_none(row.get("event_ts")),
+                message=_non_empty_str(row.get("message")),
+            )
+        )
+    return events
+
+
+def _non_empty_str(value: Any) -> str | None:
+    return value if isinstance(value, str) and value else None
+
+
+def _non_empty_strs(values: Any) -> list[str]:
+    if not isinstance(values, list):
+        return []
+    return [value for value in values if isinstance(value, str) and value]
+
+
+def _int_or_none(value: Any) -> int | None:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _update_ts_minmax(
+    minmax_by_run: dict[str, tuple[int, int]],
+    run_id: str,
+    value: int,
+) -> None:
+    current = minmax_by_run.get(run_id)
+    if current is None:
+        minmax_by_run[run_id] = (value, value)
+    elif value < current[0]:
+        minmax_by_run[run_id] = (value, current[1])
+    elif value > current[1]:
+        minmax_by_run[run_id] = (current[0], value)
+
+
+def _build_materialize_ledger_rows(
+    store: Store,
+    meta_index: dict[str, dict[tuple[str, str], Any]],
+) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
-    for claim in sorted(store.ledger.claims, key=lambda row: row.asrt_id):
-        materialize_id = _meta_str(store, claim.asrt_id, "materialize_id")
+    for claim in store.ledger.claims:
+        meta = meta_index.get(claim.asrt_id)
+        if meta is None:
+            continue
+        materialize_id = meta.get(("materialize_id", "str"))
         if materialize_id is None:
             continue
         row: dict[str, Any] = {
@@ -929,33 +997,47 @@ def _build_materialize_ledger_rows(store: Store) -> list[dict[str, Any]]:
             "asrt_id": claim.asrt_id,
             "pred_id": claim.pred_id,
             "e_ref": claim.e_ref,
-            "run_id": _meta_str(store, claim.asrt_id, "run_id"),
-            "derived_rule_id": _meta_str(store, claim.asrt_id, "derived_rule_id"),
-            "derived_rule_version": _meta_str(store, claim.asrt_id, "derived_rule_version"),
-            "key_tuple_digest": _meta_str(store, claim.asrt_id, "key_tuple_digest"),
-            "cand_key_digest": _meta_str(store, claim.asrt_id, "cand_key_digest"),
-            "support_digest": _meta_str(store, claim.asrt_id, "support_digest"),
-            "support_kind": _meta_str(store, claim.asrt_id, "support_kind"),
-            "approved_by": _meta_str(store, claim.asrt_id, "approved_by"),
-            "note": _meta_str(store, claim.asrt_id, "note"),
-            "ingested_at": _meta_time(store, claim.asrt_id, "ingested_at"),
+            "ingested_at": meta.get(("ingested_at", "time")),
         }
+        for key in _MATERIALIZE_META_STR_KEYS:
+            row[key] = meta.get((key, "str"))
         rows.append(row)
     return sorted(rows, key=lambda row: (str(row["materialize_id"]), str(row["asrt_id"])))
 
 
-def _meta_str(store: Store, asrt_id: str, key: str) -> str | None:
-    for row in store.ledger.find_meta(asrt_id=asrt_id, key=key, kind="str"):
-        if isinstance(row.value, str):
-            return row.value
-    return None
+def _build_meta_index(store: Store) -> dict[str, dict[tuple[str, str], Any]]:
+    index: dict[str, dict[tuple[str, str], Any]] = {}
+    for row in store.ledger.meta_rows:
+        if row.kind == "str":
+            if not isinstance(row.value, str):
+                continue
+        elif row.kind == "time":
+            if not isinstance(row.value, int) or isinstance(row.value, bool):
+                continue
+        index.setdefault(row.asrt_id, {}).setdefault((row.key, row.kind), row.value)
+    return index
 
 
-def _meta_time(store: Store, asrt_id: str, key: str) -> int | None:
-    for row in store.ledger.find_meta(asrt_id=asrt_id, key=key, kind="time"):
-        if isinstance(row.value, int) and not isinstance(row.value, bool):
-            return row.value
-    return None
+def _meta_str(
+    meta_index: dict[str, dict[tuple[str, str], Any]],
+    asrt_id: str,
+    key: str,
+) -> str | None:
+    entry = meta_index.get(asrt_id)
+    if entry is None:
+        return None
+    return entry.get((key, "str"))
+
+
+def _meta_time(
+    meta_index: dict[str, dict[tuple[str, str], Any]],
+    asrt_id: str,
+    key: str,
+) -> int | None:
+    entry = meta_index.get(asrt_id)
+    if entry is None:
+        return None
+    return entry.get((key, "time"))
 
 
 def _accept_write_decision_id(materialize_id: Any, asrt_id: Any) -> str | None:
@@ -966,7 +1048,10 @@ def _accept_write_decision_id(materialize_id: Any, asrt_id: Any) -> str | None:
     return f"accept_write:{materialize_id}:{asrt_id}"
 
 
-def _collect_run_materialize_ids(store: Store, candidate_asrt_ids: Any) -> tuple[list[str], list[str]]:
+def _collect_run_materialize_ids(
+    meta_index: dict[str, dict[tuple[str, str], Any]],
+    candidate_asrt_ids: Any,
+) -> tuple[list[str], list[str]]:
     if not isinstance(candidate_asrt_ids, list):
         return [], []
 
@@ -975,8 +1060,8 @@ def _collect_run_materialize_ids(store: Store, candidate_asrt_ids: Any) -> tuple
     for asrt_id in candidate_asrt_ids:
         if not isinstance(asrt_id, str) or not asrt_id:
             continue
-        run_id = _meta_str(store, asrt_id, "run_id")
-        materialize_id = _meta_str(store, asrt_id, "materialize_id")
+        run_id = _meta_str(meta_index, asrt_id, "run_id")
+        materialize_id = _meta_str(meta_index, asrt_id, "materialize_id")
         if run_id:
             run_ids.add(run_id)
         if materialize_id:
@@ -984,14 +1069,17 @@ def _collect_run_materialize_ids(store: Store, candidate_asrt_ids: Any) -> tuple
     return sorted(run_ids), sorted(materialize_ids)
 
 
-def _collect_event_ts(store: Store, candidate_asrt_ids: Any) -> int | None:
+def _collect_event_ts(
+    meta_index: dict[str, dict[tuple[str, str], Any]],
+    candidate_asrt_ids: Any,
+) -> int | None:
     if not isinstance(candidate_asrt_ids, list):
         return None
     values: list[int] = []
     for asrt_id in candidate_asrt_ids:
         if not isinstance(asrt_id, str) or not asrt_id:
             continue
-        value = _meta_time(store, asrt_id, "ingested_at")
+        value = _meta_time(meta_index, asrt_id, "ingested_at")
         if isinstance(value, int) and not isinstance(value, bool):
             values.append(value)
     if not values:
@@ -1012,10 +1100,23 @@ def _mapping_error_decision_id(pred_id: str) -> str:
 
 
 def _stable_key_hash(value: Any) -> str:
-    payload = json.dumps(
-        {"key_tuple": value},
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    ).encode("utf-8")
+    payload = ('{"key_tuple":' + _canonical_key_json(value) + "}").encode("utf-8")
     return hashlib.sha256(payload).hexdigest()[:12]
+
+
+def _canonical_key_json(value: Any) -> str:
+    # Byte-identical to json.dumps(ensure_ascii=False, sort_keys=True,
+    # separators=(",", ":")) for the atom/list subset stored in key tuples.
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is int:
+        return int.__repr__(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_canonical_key_json(item) for item in value) + "]"
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 
 
-_ENCODED_HEX_RE = re.compile(r"^_h([0-9a-f]{2})_")
+_DECODE_RE = re.compile(r"__|_h([0-9a-f]{2})_|_")
 
 
 def normalize_pred_id(pred_id: str) -> str:
@@ -26,31 +26,13 @@ def normalize_pred_id(pred_id: str) -> str:
 def denormalize_engine_pred(engine_pred: str) -> str:
     if not isinstance(engine_pred, str) or not engine_pred.startswith("p_"):
         raise ValueError("engine_pred must start with 'p_'")
+    return _DECODE_RE.sub(_decode_match, engine_pred[2:])
 
-    encoded = engine_pred[2:]
-    out: list[str] = []
-    i = 0
-    n = len(encoded)
-
-    while i < n:
-        ch = encoded[i]
-        if ch != "_":
-            out.append(ch)
-            i += 1
-            continue
-
-        if i + 1 < n and encoded[i + 1] == "_":
-            out.append("_")
-            i += 2
-            continue
-
-        match = _ENCODED_HEX_RE.match(encoded[i:])
-        if match:
-            out.append(chr(int(match.group(1), 16)))
-            i += len(match.group(0))
-            continue
-
-        out.append(":")
-        i += 1
-
-    return "".join(out)
+
+def _decode_match(match: re.Match[str]) -> str:
+    token = match.group(0)
+    if token == "__":
+        return "_"
+    if token == "_":
+        return ":"
+    return chr(int(match.group(1), 16))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Sequence
 
 
 def tsv_cell_v1_encode(x: str) -> str:
@@ -39,15 +40,15 @@ def tsv_cell_v1_decode(s: str) -> str:
     return "".join(out)
 
 
-def write_tsv(path: Path, rows: list[list[str]]) -> None:
+def write_tsv(path: Path, rows: Sequence[Sequence[str]]) -> None:
     if not isinstance(path, Path):
         path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
     lines: list[str] = []
     for row in rows:
-        if not isinstance(row, list):
-            raise TypeError("each row must be list[str]")
+        if not isinstance(row, (list, tuple)):
+            raise TypeError("each row must be list[str] or tuple[str, ...]")
         encoded_row: list[str] = []
         for cell in row:
             if not isinstance(cell, str):
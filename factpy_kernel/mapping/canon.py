@@ -3,10 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-from factpy_kernel.policy.active import is_active
-from factpy_kernel.policy.chosen import choose_one
-from factpy_kernel.store.ledger import Claim, Ledger
-from factpy_kernel.view.projector import build_args_for_claim
+from factpy_kernel.store.ledger import Claim, Ledger, MetaRow
+from factpy_kernel.view.projector import build_args_for_claims
 
 
 class MappingResolveError(Exception):
@@ -19,7 +17,7 @@ class MappingConflictError(MappingResolveError):
         self.conflicts = list(conflicts)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MappingCandidate:
     asrt_id: str
     key_tuple: tuple[Any, ...]
@@ -29,7 +27,7 @@ class MappingCandidate:
     ingested_at: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MappingDecision:
     key_tuple: tuple[Any, ...]
     chosen_asrt_id: str
@@ -38,7 +36,7 @@ class MappingDecision:
     candidate_asrt_ids: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MappingResolution:
     pred_id: str
     chosen_map: dict[tuple[Any, ...], tuple[Any, ...]]
@@ -75,28 +73,44 @@ def resolve_mapping_predicate(ledger: Ledger, schema_pred: dict) -> MappingResol
     if not value_positions:
         raise MappingResolveError("mapping_value_positions must be non-empty")
 
-    tie_break_mode, tie_break_conf = _normalize_tie_break(schema_pred.get("tie_break"))
+    tie_break_mode, source_order = _normalize_tie_break(schema_pred.get("tie_break"))
 
+    active_asrt_ids = ledger.active_asrt_id_set()
     claims = [
         claim
         for claim in ledger.find_claims(pred_id=pred_id)
-        if is_active(ledger, claim.asrt_id)
+        if claim.asrt_id in active_asrt_ids
     ]
 
+    meta_by_asrt_id = _meta_index(ledger, [claim.asrt_id for claim in claims])
+    args_by_claim = build_args_for_claims(ledger, claims)
+
     grouped: dict[tuple[Any, ...], list[MappingCandidate]] = {}
+    conflicting_keys: set[tuple[Any, ...]] = set()
     all_candidates: list[MappingCandidate] = []
-    for claim in claims:
-        cand = _candidate_from_claim(ledger, claim, key_positions, value_positions)
+    for claim, args in zip(claims, args_by_claim):
+        cand = _candidate_from_claim(
+            claim,
+            args,
+            key_positions,
+            value_positions,
+            meta_by_asrt_id.get(claim.asrt_id, {}),
+        )
         all_candidates.append(cand)
-        grouped.setdefault(cand.key_tuple, []).append(cand)
+        group = grouped.get(cand.key_tuple)
+        if group is None:
+            grouped[cand.key_tuple] = [cand]
+            continue
+        if cand.value_tuple != group[0].value_tuple:
+            conflicting_keys.add(cand.key_tuple)
+        group.append(cand)
 
     chosen_map: dict[tuple[Any, ...], tuple[Any, ...]] = {}
     decisions: list[MappingDecision] = []
     conflicts: list[dict[str, Any]] = []
 
     for key_tuple, candidates in grouped.items():
-        distinct_values = {cand.value_tuple for cand in candidates}
-        if len(distinct_values) <= 1:
+        if key_tuple not in conflicting_keys:
             chosen = candidates[0]
             chosen_map[key_tuple] = chosen.value_tuple
             decisions.append(
@@ -111,6 +125,7 @@ def resolve_mapping_predicate(ledger: Ledger, schema_pred: dict) -> MappingResol
             continue
 
         if tie_break_mode == "error":
+            distinct_values = {cand.value_tuple for cand in candidates}
             conflicts.append(
                 {
                     "key_tuple": key_tuple,
@@ -120,7 +135,7 @@ def resolve_mapping_predicate(ledger: Ledger, schema_pred: dict) -> MappingResol
             )
             continue
 
-        chosen = _choose_with_tie_break(candidates, tie_break_mode, tie_break_conf, ledger)
+        chosen = _choose_with_tie_break(candidates, tie_break_mode, source_order)
         chosen_map[key_tuple] = chosen.value_tuple
         decisions.append(
             MappingDecision(
@@ -138,27 +153,28 @@ def resolve_mapping_predicate(ledger: Ledger, schema_pred: dict) -> MappingResol
             conflicts,
         )
 
+    sort_keys = {key_tuple: tuple(str(x) for x in key_tuple) for key_tuple in grouped}
     return MappingResolution(
         pred_id=pred_id,
         chosen_map=chosen_map,
-        candidates=sorted(all_candidates, key=lambda c: (tuple(str(x) for x in c.key_tuple), c.asrt_id)),
-        decisions=sorted(decisions, key=lambda d: (tuple(str(x) for x in d.key_tuple), d.chosen_asrt_id)),
+        candidates=sorted(all_candidates, key=lambda c: (sort_keys[c.key_tuple], c.asrt_id)),
+        decisions=sorted(decisions, key=lambda d: (sort_keys[d.key_tuple], d.chosen_asrt_id)),
         conflicts=conflicts,
     )
 
 
 def _candidate_from_claim(
-    ledger: Ledger,
     claim: Claim,
+    args: tuple[Any, ...],
     key_positions: tuple[int, ...],
     value_positions: tuple[int, ...],
+    meta: dict[str, list[MetaRow]],
 ) -> MappingCandidate:
-    args = build_args_for_claim(ledger, claim)
     key_tuple = tuple(args[idx] for idx in key_positions)
     value_tuple = tuple(args[idx] for idx in value_positions)
-    ingested_at = _required_meta_time(ledger, claim.asrt_id, "ingested_at")
-    source = _optional_meta_str(ledger, claim.asrt_id, "source")
-    confidence = _optional_confidence(ledger, claim.asrt_id)
+    ingested_at = _required_meta_time(meta, claim.asrt_id, "ingested_at")
+    source = _optional_meta_str(meta, "source")
+    confidence = _optional_confidence(meta)
     return MappingCandidate(
         asrt_id=claim.asrt_id,
         key_tuple=key_tuple,
@@ -186,69 +202,80 @@ def _normalize_positions(raw: Any, arg_count: int, field_name: str) -> tuple[int
     return tuple(out)
 
 
-def _normalize_tie_break(raw: Any) -> tuple[str, dict[str, Any]]:
+def _normalize_tie_break(raw: Any) -> tuple[str, dict[str, int] | None]:
+    # Returns the mode and, for prefer_source, the source -> rank map.
     if raw is None:
-        return "error", {}
+        return "error", None
     if isinstance(raw, str):
         mode = raw
         conf: dict[str, Any] = {}
     elif isinstance(raw, dict):
         mode = raw.get("mode")
-        conf = dict(raw)
+        conf = raw
     else:
         raise MappingResolveError("tie_break must be null|string|object")
 
     if mode not in {"error", "latest_by_ingested_at_then_min_assertion_id", "prefer_source", "max_confidence"}:
         raise MappingResolveError(f"unsupported tie_break mode: {mode}")
-    return mode, conf
+    if mode == "prefer_source":
+        source_rank = conf.get("source_rank")
+        # An invalid source_rank is only reported once a tie actually needs it.
+        if isinstance(source_rank, list) and all(isinstance(x, str) for x in source_rank):
+            return mode, {name: idx for idx, name in enumerate(source_rank)}
+    return mode, None
 
 
 def _choose_with_tie_break(
     candidates: list[MappingCandidate],
     mode: str,
-    conf: dict[str, Any],
-    ledger: Ledger,
+    source_order: dict[str, int] | None,
 ) -> MappingCandidate:
     if mode == "latest_by_ingested_at_then_min_assertion_id":
-        return max(
-            candidates,
-            key=lambda c: (c.ingested_at, _invert_for_min_asrt(c.asrt_id)),
-        )
+        return min(candidates, key=lambda c: (-c.ingested_at, c.asrt_id))
 
     if mode == "prefer_source":
-        source_rank = conf.get("source_rank")
-        if not isinstance(source_rank, list) or not all(isinstance(x, str) for x in source_rank):
+        if source_order is None:
             raise MappingResolveError("prefer_source requires tie_break.source_rank string list")
-        order = {name: idx for idx, name in enumerate(source_rank)}
-        rank_sorted = sorted(
+        return min(
             candidates,
             key=lambda c: (
-                order.get(c.source, len(order)),
+                source_order.get(c.source, len(source_order)),
                 -c.ingested_at,
                 c.asrt_id,
             ),
         )
-        return rank_sorted[0]
 
     if mode == "max_confidence":
-        with_conf = [c for c in candidates if c.confidence is not None]
-        if not with_conf:
+        max_conf: float | None = None
+        bucket: list[MappingCandidate] = []
+        for c in candidates:
+            if c.confidence is None:
+                continue
+            if max_conf is None or c.confidence > max_conf:
+                max_conf = c.confidence
+                bucket = [c]
+            elif c.confidence == max_conf:
+                bucket.append(c)
+        if not bucket:
             raise MappingResolveError("max_confidence requires numeric confidence meta")
-        max_conf = max(c.confidence for c in with_conf if c.confidence is not None)
-        bucket = [c for c in with_conf if c.confidence == max_conf]
-        if len(bucket) == 1:
-            return bucket[0]
-        chosen_asrt = choose_one(ledger, [c.asrt_id for c in bucket])
-        for c in bucket:
-            if c.asrt_id == chosen_asrt:
-                return c
-        raise MappingResolveError("internal error resolving max_confidence tie")
+        # Candidates already carry their validated ingested_at, so ties are
+        # broken like choose_one without re-reading the ledger meta rows.
+        return min(bucket, key=lambda c: (-c.ingested_at, c.asrt_id))
 
     raise MappingResolveError(f"unsupported tie_break mode: {mode}")
 
 
-def _required_meta_time(ledger: Ledger, asrt_id: str, key: str) -> int:
-    rows = ledger.find_meta(asrt_id=asrt_id, key=key)
+def _meta_index(ledger: Ledger, asrt_ids: list[str]) -> dict[str, dict[str, list[MetaRow]]]:
+    wanted = set(asrt_ids)
+    index: dict[str, dict[str, list[MetaRow]]] = {}
+    for row in ledger.meta_rows:
+        if row.asrt_id in wanted:
+            index.setdefault(row.asrt_id, {}).setdefault(row.key, []).append(row)
+    return index
+
+
+def _required_meta_time(meta: dict[str, list[MetaRow]], asrt_id: str, key: str) -> int:
+    rows = meta.get(key, [])
     if len(rows) != 1:
         raise MappingResolveError(f"{asrt_id} requires exactly one {key}")
     row = rows[0]
@@ -257,8 +284,8 @@ def _required_meta_time(ledger: Ledger, asrt_id: str, key: str) -> int:
     return row.value
 
 
-def _optional_meta_str(ledger: Ledger, asrt_id: str, key: str) -> str | None:
-    rows = ledger.find_meta(asrt_id=asrt_id, key=key, kind="str")
+def _optional_meta_str(meta: dict[str, list[MetaRow]], key: str) -> str | None:
+    rows = [row for row in meta.get(key, []) if row.kind == "str"]
     if not rows:
         return None
     value = rows[-1].value
@@ -267,15 +294,11 @@ def _optional_meta_str(ledger: Ledger, asrt_id: str, key: str) -> str | None:
     return value
 
 
-def _optional_confidence(ledger: Ledger, asrt_id: str) -> float | None:
-    rows = ledger.find_meta(asrt_id=asrt_id, key="confidence")
+def _optional_confidence(meta: dict[str, list[MetaRow]]) -> float | None:
+    rows = meta.get("confidence", [])
     if not rows:
         return None
     row = rows[-1]
     if row.kind == "num" and isinstance(row.value, int) and not isinstance(row.value, bool):
         return float(row.value)
     return None
-
-
-def _invert_for_min_asrt(asrt_id: str) -> tuple[int, ...]:
-    return tuple(-ord(ch) for ch in asrt_id)
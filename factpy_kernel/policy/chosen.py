@@ -3,9 +3,8 @@ from __future__ import annotations
 from typing import Any
 
 from factpy_kernel.evidence.write_protocol import PolicyNonDeterminismError
-from factpy_kernel.policy.active import is_active
 from factpy_kernel.protocol.tup_v1 import claim_args_from_rest_terms
-from factpy_kernel.store.ledger import Claim, ClaimArg, Ledger
+from factpy_kernel.store.ledger import Claim, Ledger, MetaRow
 
 
 def choose_one(ledger: Ledger, asrt_ids: list[str]) -> str:
@@ -14,19 +13,19 @@ def choose_one(ledger: Ledger, asrt_ids: list[str]) -> str:
     if not asrt_ids:
         raise PolicyNonDeterminismError("choose_one requires at least one asrt_id")
 
-    candidates: list[tuple[str, int]] = []
-    for asrt_id in asrt_ids:
-        ingested_at = _read_required_ingested_at(ledger, asrt_id)
-        candidates.append((asrt_id, ingested_at))
-
-    candidates.sort(key=lambda item: (-item[1], item[0].encode("utf-8")))
-    return candidates[0][0]
+    ingested_at_by_asrt_id = _read_ingested_at_map(ledger, asrt_ids)
+    return min(
+        ingested_at_by_asrt_id,
+        key=lambda asrt_id: (-ingested_at_by_asrt_id[asrt_id], asrt_id),
+    )
 
 
 def group_key_for_claim(
     schema_pred: dict,
     claim: Claim,
     ledger: Ledger | None = None,
+    *,
+    indexes_by_arg_count: dict[int, tuple[int, ...]] | None = None,
 ) -> tuple:
     if not isinstance(schema_pred, dict):
         raise PolicyNonDeterminismError("schema_pred must be dict")
@@ -34,15 +33,10 @@ def group_key_for_claim(
         raise PolicyNonDeterminismError("claim must be Claim")
 
     args = _args_for_claim(claim, ledger)
-    group_key_indexes = _read_group_key_indexes(schema_pred, arg_count=len(args))
-
-    dims: list[Any] = []
-    for idx in group_key_indexes:
-        if idx == 0:
-            continue
-        dims.append(args[idx])
-
-    return (claim.pred_id, claim.e_ref, *dims)
+    if indexes_by_arg_count is None:
+        indexes_by_arg_count = {}
+    dim_indexes = _dim_indexes_for_arg_count(schema_pred, len(args), indexes_by_arg_count)
+    return _group_key_from_args(claim, args, dim_indexes)
 
 
 def compute_chosen_for_predicate(ledger: Ledger, schema_pred: dict) -> dict[tuple, str]:
@@ -56,33 +50,57 @@ def compute_chosen_for_predicate(ledger: Ledger, schema_pred: dict) -> dict[tupl
         raise PolicyNonDeterminismError("schema_pred.pred_id must be non-empty string")
 
     cardinality = schema_pred.get("cardinality", "functional")
+    active_asrt_ids = ledger.active_asrt_id_set()
     claims = [
         claim
         for claim in ledger.find_claims(pred_id=pred_id)
-        if is_active(ledger, claim.asrt_id)
+        if claim.asrt_id in active_asrt_ids
     ]
 
+    # group_key_indexes only depend on the arg count, so validate them once per
+    # distinct arity instead of once per claim.
+    indexes_by_arg_count: dict[int, tuple[int, ...]] = {}
+
+    def claim_group_key(claim: Claim) -> tuple:
+        args = _args_for_claim(claim, ledger)
+        dim_indexes = _dim_indexes_for_arg_count(schema_pred, len(args), indexes_by_arg_count)
+        return _group_key_from_args(claim, args, dim_indexes)
+
     if cardinality == "multi" or cardinality == "temporal":
         chosen: dict[tuple, str] = {}
         for claim in claims:
-            base_key = group_key_for_claim(schema_pred, claim, ledger=ledger)
+            base_key = claim_group_key(claim)
             # MVP hard constraint: multi/temporal paths treat every active assertion as chosen.
             chosen[(*base_key, claim.asrt_id)] = claim.asrt_id
         return chosen
 
-    groups: dict[tuple, list[str]] = {}
+    # Same ordering as choose_one, tracked per group in a single pass so no
+    # per-group candidate lists or ingested_at re-reads are needed.
+    ingested_at_by_asrt_id = _read_ingested_at_map(ledger, [claim.asrt_id for claim in claims])
+    best: dict[tuple, tuple[tuple[int, str], str]] = {}
     for claim in claims:
-        group_key = group_key_for_claim(schema_pred, claim, ledger=ledger)
-        groups.setdefault(group_key, []).append(claim.asrt_id)
+        group_key = claim_group_key(claim)
+        rank = (-ingested_at_by_asrt_id[claim.asrt_id], claim.asrt_id)
+        current = best.get(group_key)
+        if current is None or rank < current[0]:
+            best[group_key] = (rank, claim.asrt_id)
+
+    return {group_key: asrt_id for group_key, (_, asrt_id) in best.items()}
+
 
-    chosen_map: dict[tuple, str] = {}
-    for group_key, asrt_ids in groups.items():
-        chosen_map[group_key] = choose_one(ledger, asrt_ids)
-    return chosen_map
+def _read_ingested_at_map(ledger: Ledger, asrt_ids: list[str]) -> dict[str, int]:
+    rows_by_asrt_id: dict[str, list[MetaRow]] = {asrt_id: [] for asrt_id in asrt_ids}
+    for row in ledger.find_meta(key="ingested_at"):
+        bucket = rows_by_asrt_id.get(row.asrt_id)
+        if bucket is not None:
+            bucket.append(row)
+    return {
+        asrt_id: _required_ingested_at(asrt_id, rows)
+        for asrt_id, rows in rows_by_asrt_id.items()
+    }
 
 
-def _read_required_ingested_at(ledger: Ledger, asrt_id: str) -> int:
-    rows = ledger.find_meta(asrt_id=asrt_id, key="ingested_at")
+def _required_ingested_at(asrt_id: str, rows: list[MetaRow]) -> int:
     if len(rows) != 1:
         raise PolicyNonDeterminismError(
             f"asrt_id={asrt_id} must have exactly one ingested_at meta row"
@@ -95,6 +113,27 @@ def _read_required_ingested_at(ledger: Ledger, asrt_id: str) -> int:
     return row.value
 
 
+def _group_key_from_args(claim: Claim, args: list[Any], dim_indexes: tuple[int, ...]) -> tuple:
+    return (claim.pred_id, claim.e_ref, *[args[idx] for idx in dim_indexes])
+
+
+def _dim_indexes_for_arg_count(
+    schema_pred: dict,
+    arg_count: int,
+    indexes_by_arg_count: dict[int, tuple[int, ...]],
+) -> tuple[int, ...]:
+    dim_indexes = indexes_by_arg_count.get(arg_count)
+    if dim_indexes is None:
+        group_key_indexes = _read_group_key_indexes(schema_pred, arg_count=arg_count)
+        # Validated indexes are strictly ascending and non-negative, so the
+        # entity position can only be the first entry.
+        if group_key_indexes and group_key_indexes[0] == 0:
+            group_key_indexes = group_key_indexes[1:]
+        dim_indexes = tuple(group_key_indexes)
+        indexes_by_arg_count[arg_count] = dim_indexes
+    return dim_indexes
+
+
 def _read_group_key_indexes(schema_pred: dict, arg_count: int) -> list[int]:
     group_key_indexes = schema_pred.get("group_key_indexes")
     if not isinstance(group_key_indexes, list):
@@ -120,27 +159,20 @@ def _args_for_claim(claim: Claim, ledger: Ledger | None) -> list[Any]:
 
 
 def _val_atoms_for_claim(claim: Claim, ledger: Ledger | None) -> list[Any]:
-    rows = _claim_arg_rows(ledger, claim.asrt_id) if ledger is not None else []
+    rows = ledger.claim_args_for(claim.asrt_id) if ledger is not None else []
 
     if rows:
-        sorted_rows = sorted(rows, key=lambda row: row.idx)
         expected_count = len(claim.rest_terms)
-        if len(sorted_rows) != expected_count:
+        if len(rows) != expected_count:
             raise PolicyNonDeterminismError(
                 f"asrt_id={claim.asrt_id} claim_arg count mismatch"
             )
-        for expected_idx, row in enumerate(sorted_rows):
+        for expected_idx, row in enumerate(rows):
             if row.idx != expected_idx:
                 raise PolicyNonDeterminismError(
                     f"asrt_id={claim.asrt_id} claim_arg idx must be contiguous"
                 )
-        return [row.val_atom for row in sorted_rows]
+        return [row.val_atom for row in rows]
 
     fallback_rows = claim_args_from_rest_terms(claim.rest_terms)
     return [val_atom for _, val_atom, _ in fallback_rows]
-
-
-def _claim_arg_rows(ledger: Ledger | None, asrt_id: str) -> list[ClaimArg]:
-    if ledger is None:
-        return []
-    return [row for row in ledger.claim_args if row.asrt_id == asrt_id]
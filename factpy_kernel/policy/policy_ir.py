@@ -13,6 +13,12 @@ class PolicyIRValidationError(Exception):
 
 _REQUIRED_SCHEMA_PROTOCOL_KEYS = ("idref_v1", "tup_v1", "export_v1")
 
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+)
+
 
 def build_policy_ir_v1(schema_ir: dict, policy_mode: str = "edb") -> dict:
     if not isinstance(schema_ir, dict):
@@ -53,15 +59,10 @@ def canonicalize_policy_ir_jcs(policy_ir: dict) -> bytes:
     if not isinstance(policy_ir, dict):
         raise PolicyIRValidationError("policy_ir must be dict")
 
-    _reject_floats(policy_ir, "$")
+    _reject_floats(policy_ir)
 
     try:
-        return json.dumps(
-            policy_ir,
-            sort_keys=True,
-            separators=(",", ":"),
-            ensure_ascii=False,
-        ).encode("utf-8")
+        return _CANONICAL_ENCODER.encode(policy_ir).encode("utf-8")
     except (TypeError, ValueError) as exc:
         raise PolicyIRValidationError(f"failed to canonicalize policy_ir: {exc}") from exc
 
@@ -71,7 +72,23 @@ def policy_digest(policy_ir: dict) -> str:
     return sha256_token(canonical)
 
 
-def _reject_floats(value: Any, path: str) -> None:
+def _reject_floats(root: Any) -> None:
+    stack = [root]
+    pop = stack.pop
+    while stack:
+        value = pop()
+        if isinstance(value, dict):
+            for key in value:
+                if not isinstance(key, str):
+                    _raise_non_canonical_at(root, "$")
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, float):
+            _raise_non_canonical_at(root, "$")
+
+
+def _raise_non_canonical_at(value: Any, path: str) -> None:
     if isinstance(value, float):
         raise PolicyIRValidationError(f"float is not allowed in policy_ir at {path}")
     if isinstance(value, dict):
@@ -80,7 +97,7 @@ def _reject_floats(value: Any, path: str) -> None:
                 raise PolicyIRValidationError(
                     f"policy_ir object key must be string at {path}"
                 )
-            _reject_floats(child, f"{path}.{key}")
+            _raise_non_canonical_at(child, f"{path}.{key}")
     elif isinstance(value, list):
         for index, child in enumerate(value):
-            _reject_floats(child, f"{path}[{index}]")
+            _raise_non_canonical_at(child, f"{path}[{index}]")
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from factpy_kernel.rules.where_eval import WhereValidationError, evaluate_where
 from factpy_kernel.store.api import Store
-from factpy_kernel.view.projector import project_view_facts
+from factpy_kernel.view.projector import cached_project_view_facts
+
+
+_NON_ALNUM_RE = re.compile(r"[\W_]")
 
 
 class RuleCompileError(Exception):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleSpec:
     rule_id: str
     version: str
@@ -47,10 +52,10 @@ class RuleRegistry:
         self._rules[key] = rule_spec
 
     def resolve(self, rule_id: str, version: str) -> RuleSpec:
-        key = (rule_id, version)
-        if key not in self._rules:
+        rule_spec = self._rules.get((rule_id, version))
+        if rule_spec is None:
             raise RuleCompileError(f"unknown RuleRef: {rule_id}@{version}")
-        return self._rules[key]
+        return rule_spec
 
 
 def run_rule(
@@ -69,18 +74,21 @@ def run_rule(
     if temporal_view not in {"record", "current"}:
         raise RuleCompileError("temporal_view must be 'record' or 'current'")
 
-    base_view_facts = project_view_facts(store.ledger, store.schema_ir, temporal_view=temporal_view)
+    # Exposed RuleRef results are added to view_facts as they are memoized, so
+    # every rule evaluation sees the same dict without rebuilding it.
+    view_facts = cached_project_view_facts(store.ledger, store.schema_ir, temporal_view=temporal_view)
     memo_rows: dict[tuple[str, str], list[tuple[Any, ...]]] = {}
     stack: set[tuple[str, str]] = set()
     return _evaluate_rule(
         rule_spec,
         registry,
-        base_view_facts,
+        view_facts,
         memo_rows,
         stack,
     )
 
 
+@lru_cache(maxsize=1024)
 def internal_rule_pred_id(rule_id: str, version: str) -> str:
     safe_rule = _sanitize(rule_id)
     safe_ver = _sanitize(version)
@@ -88,19 +96,18 @@ def internal_rule_pred_id(rule_id: str, version: str) -> str:
 
 
 def _sanitize(text: str) -> str:
-    out: list[str] = []
-    for ch in text:
-        if ch.isalnum():
-            out.append(ch.lower())
-        else:
-            out.append("_")
-    return "".join(out)
+    sanitized = _NON_ALNUM_RE.sub("_", text)
+    # Whole-string lower() turns a word-final capital sigma into final sigma;
+    # ids are lowercased per character, so those inputs take the slow path.
+    if "\u03a3" in sanitized:
+        return "".join([ch.lower() for ch in sanitized])
+    return sanitized.lower()
 
 
 def _evaluate_rule(
     rule_spec: RuleSpec,
     registry: RuleRegistry,
-    base_view_facts: dict[str, list[tuple[Any, ...]]],
+    view_facts: dict[str, list[tuple[Any, ...]]],
     memo_rows: dict[tuple[str, str], list[tuple[Any, ...]]],
     stack: set[tuple[str, str]],
 ) -> list[tuple[Any, ...]]:
@@ -112,20 +119,13 @@ def _evaluate_rule(
 
     stack.add(key)
     try:
-        rewritten_where, ref_overlay = _rewrite_where_rule_refs(
+        rewritten_where = _rewrite_where_rule_refs(
             rule_spec.where,
             registry,
-            base_view_facts,
+            view_facts,
             memo_rows,
             stack,
         )
-        view_facts = dict(base_view_facts)
-        for (dep_rule_id, dep_version), dep_rows in memo_rows.items():
-            dep_spec = registry.resolve(dep_rule_id, dep_version)
-            if dep_spec.expose:
-                view_facts[internal_rule_pred_id(dep_rule_id, dep_version)] = dep_rows
-        for pred_id, rows in ref_overlay.items():
-            view_facts[pred_id] = rows
 
         try:
             bindings = evaluate_where(view_facts, rewritten_where)
@@ -135,6 +135,7 @@ def _evaluate_rule(
         rows = _rows_from_bindings(bindings, rule_spec.select_vars)
         if rule_spec.expose:
             memo_rows[key] = rows
+            view_facts[internal_rule_pred_id(rule_spec.rule_id, rule_spec.version)] = rows
         return rows
     finally:
         stack.remove(key)
@@ -143,12 +144,10 @@ def _evaluate_rule(
 def _rewrite_where_rule_refs(
     where: list[Any],
     registry: RuleRegistry,
-    base_view_facts: dict[str, list[tuple[Any, ...]]],
+    view_facts: dict[str, list[tuple[Any, ...]]],
     memo_rows: dict[tuple[str, str], list[tuple[Any, ...]]],
     stack: set[tuple[str, str]],
-) -> tuple[list[Any], dict[str, list[tuple[Any, ...]]]]:
-    overlay: dict[str, list[tuple[Any, ...]]] = {}
-
+) -> list[Any]:
     def rewrite_atom(atom: Any) -> Any:
         if not isinstance(atom, tuple) or not atom:
             return atom
@@ -171,32 +170,31 @@ def _rewrite_where_rule_refs(
             raise RuleCompileError(
                 f"RuleRef arity mismatch for {rule_id}@{version}: expected {len(ref_spec.select_vars)}, got {len(terms)}"
             )
-        rows = _evaluate_rule(ref_spec, registry, base_view_facts, memo_rows, stack)
-        pred_id = internal_rule_pred_id(rule_id, version)
-        overlay[pred_id] = rows
-        return ("pred", pred_id, terms)
-
-    if all(isinstance(item, tuple) for item in where):
-        return [rewrite_atom(item) for item in where], overlay
-    if all(isinstance(item, list) for item in where):
+        _evaluate_rule(ref_spec, registry, view_facts, memo_rows, stack)
+        return ("pred", internal_rule_pred_id(rule_id, version), terms)
+
+    # The first item decides between a flat atom list and DNF branches; any
+    # other shape is left for evaluate_where to reject.
+    if not where:
+        return where
+    if isinstance(where[0], tuple):
+        return [rewrite_atom(item) for item in where]
+    if isinstance(where[0], list):
         out_branches: list[list[Any]] = []
         for branch in where:
             if not isinstance(branch, list):
                 raise RuleCompileError("invalid where branch")
             out_branches.append([rewrite_atom(atom) for atom in branch])
-        return out_branches, overlay
-    return where, overlay
+        return out_branches
+    return where
 
 
 def _rows_from_bindings(bindings: list[dict[str, Any]], select_vars: list[str]) -> list[tuple[Any, ...]]:
-    rows: list[tuple[Any, ...]] = []
+    rows: dict[tuple[Any, ...], None] = {}
     for binding in bindings:
-        row: list[Any] = []
-        for var in select_vars:
-            if var not in binding:
-                raise RuleCompileError(f"select var is unbound: {var}")
-            row.append(binding[var])
-        rows.append(tuple(row))
-
-    dedup = sorted(set(rows), key=lambda row: tuple(str(cell) for cell in row))
-    return dedup
+        try:
+            rows[tuple([binding[var] for var in select_vars])] = None
+        except KeyError as exc:
+            raise RuleCompileError(f"select var is unbound: {exc.args[0]}") from exc
+
+    return sorted(rows, key=lambda row: tuple(str(cell) for cell in row))
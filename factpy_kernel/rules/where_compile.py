@@ -1,11 +1,34 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import json
-from typing import Any
+import sys
+from functools import lru_cache
+from json.encoder import encode_basestring
+from typing import Any, Callable
 
 from factpy_kernel.export.pred_norm import normalize_pred_id
 from factpy_kernel.rules.where_eval import WhereValidationError
+from factpy_kernel.schema.schema_ir import schema_predicates_fingerprint
+
+
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+)
+
+_CMP_OPS = {"gt": ">", "ge": ">=", "lt": "<", "le": "<="}
+_CMP_TYPE_DOMAINS = frozenset({"int", "time"})
+_NOT_BODY_KINDS = frozenset({"pred", "eq", "in", *_CMP_OPS})
+_TEMPORAL_VIEWS = frozenset({"record", "current"})
+
+_SCHEMA_INFO_CACHE_MAX = 32
+_SCHEMA_INFO_CACHE: dict[
+    int,
+    tuple[dict, str, dict[str, list[str]], dict[str, tuple[int, str, str]]],
+] = {}
 
 
 def compile_where_to_query_dl(
@@ -19,26 +42,41 @@ def compile_where_to_query_dl(
         raise WhereValidationError("schema_ir must be dict")
     if not isinstance(query_rel, str) or not query_rel:
         raise WhereValidationError("query_rel must be non-empty string")
-    if temporal_view not in {"record", "current"}:
+    if temporal_view not in _TEMPORAL_VIEWS:
         raise WhereValidationError("temporal_view must be 'record' or 'current'")
 
-    pred_type_domains = _schema_pred_type_domains(schema_ir)
-    pred_arities = {pred_id: len(arg_types) for pred_id, arg_types in pred_type_domains.items()}
-    temporal_pred_ids = _temporal_pred_ids(schema_ir)
-    bodies = _normalize_where_subset(where)
-    variables = extract_where_variables(where)
+    pred_type_domains, pred_info = _schema_info(schema_ir)
+    # Not bodies normalized during validation, keyed by id(not_body); where
+    # stays alive for the whole compile so the ids are stable.
+    normalized_not_bodies: dict[int, list[list[tuple[Any, ...]]]] = {}
+    bodies = _normalize_where_subset(where, normalized_not_bodies)
+    variables = _variables_from_bodies(bodies)
     if not variables:
         raise WhereValidationError("where must contain at least one variable")
 
-    var_symbols = {var: f"C{i}" for i, var in enumerate(variables)}
-    head_vars = [var_symbols[var] for var in variables]
-    query_decl_cols = [f"{var_symbols[var]}:symbol" for var in variables]
+    var_symbols: dict[str, str] = {}
+    head_vars: list[str] = []
+    query_decl_cols: list[str] = []
+    for i, var in enumerate(variables):
+        symbol = f"C{i}"
+        var_symbols[var] = symbol
+        head_vars.append(symbol)
+        query_decl_cols.append(f"{symbol}:symbol")
 
     in_rel_values: dict[str, tuple[str, ...]] = {}
     not_rel_defs: dict[str, tuple[tuple[str, ...], tuple[tuple[str, ...], ...]]] = {}
-    rule_lines: list[str] = []
+    rule_buf = io.StringIO()
+    # Every OR branch shares the same head.
+    rule_head = f'{query_rel}({", ".join(head_vars)}) :- '
 
+    # Identical OR branches compile to identical rules; emit each only once.
+    seen_bodies: set[str] = set()
     for body in bodies:
+        if len(bodies) > 1:
+            body_key = _CANONICAL_ENCODER.encode(body)
+            if body_key in seen_bodies:
+                continue
+            seen_bodies.add(body_key)
         bound_vars: set[str] = set()
         var_type_domains = _infer_var_type_domains(body, pred_type_domains)
         body_terms: list[str] = []
@@ -46,7 +84,7 @@ def compile_where_to_query_dl(
             body_terms.append(
                 _compile_atom(
                     atom=atom,
-                    pred_arities=pred_arities,
+                    pred_info=pred_info,
                     pred_type_domains=pred_type_domains,
                     var_symbols=var_symbols,
                     bound_vars=bound_vars,
@@ -54,8 +92,8 @@ def compile_where_to_query_dl(
                     in_rel_values=in_rel_values,
                     query_variables=variables,
                     not_rel_defs=not_rel_defs,
+                    normalized_not_bodies=normalized_not_bodies,
                     temporal_view=temporal_view,
-                    temporal_pred_ids=temporal_pred_ids,
                 )
             )
         missing_vars = [var for var in variables if var not in bound_vars]
@@ -64,48 +102,45 @@ def compile_where_to_query_dl(
                 "where branch must bind all query variables; missing: "
                 + ", ".join(missing_vars)
             )
-        rule_lines.append(f'{query_rel}({", ".join(head_vars)}) :- {", ".join(body_terms)}.')
-
-    lines: list[str] = []
-    for rel_name in sorted(in_rel_values):
-        values = in_rel_values[rel_name]
-        lines.append(f'.decl {rel_name}(V:symbol)')
-        for text in values:
-            lines.append(f'{rel_name}({_text_to_symbol(text)}).')
-        lines.append("")
-
-    for rel_name in sorted(not_rel_defs):
-        key_vars, body_term_groups = not_rel_defs[rel_name]
-        if key_vars:
-            key_decl_cols = ", ".join(f"K{i}:symbol" for i in range(len(key_vars)))
-            head_args = ", ".join(var_symbols[var] for var in key_vars)
-            lines.append(f".decl {rel_name}({key_decl_cols})")
-            for body_terms in body_term_groups:
-                lines.append(f'{rel_name}({head_args}) :- {", ".join(body_terms)}.')
-        else:
-            lines.append(f".decl {rel_name}()")
-            for body_terms in body_term_groups:
-                lines.append(f'{rel_name}() :- {", ".join(body_terms)}.')
-        lines.append("")
-
-    lines.extend(
-        [
-            f'.decl {query_rel}({", ".join(query_decl_cols)})',
-            f'.output {query_rel}',
-            "",
-            *rule_lines,
-        ]
-    )
-    return "\n".join(lines).rstrip() + "\n"
+        rule_buf.write(rule_head)
+        rule_buf.write(", ".join(body_terms))
+        rule_buf.write(".\n")
+
+    buf = io.StringIO()
+    # Emission stays sorted by relation name so query.dl does not depend on
+    # the order atoms appear in where.
+    for rel_name, values in sorted(in_rel_values.items()):
+        buf.write(f".decl {rel_name}(V:symbol)\n")
+        fact_prefix = f"{rel_name}("
+        buf.write("".join([f"{fact_prefix}{symbol}).\n" for symbol in map(_text_to_symbol, values)]))
+        buf.write("\n")
+
+    for rel_name, (key_vars, body_term_groups) in sorted(not_rel_defs.items()):
+        key_decl_cols = ", ".join([f"K{i}:symbol" for i in range(len(key_vars))])
+        not_head = f'{rel_name}({", ".join([var_symbols[var] for var in key_vars])}) :- '
+        buf.write(f".decl {rel_name}({key_decl_cols})\n")
+        for body_terms in body_term_groups:
+            buf.write(not_head)
+            buf.write(", ".join(body_terms))
+            buf.write(".\n")
+        buf.write("\n")
+
+    buf.write(f'.decl {query_rel}({", ".join(query_decl_cols)})\n')
+    buf.write(f".output {query_rel}\n")
+    buf.write("\n")
+    buf.write(rule_buf.getvalue())
+    return buf.getvalue().rstrip() + "\n"
 
 
 def extract_where_variables(where: list[Any]) -> list[str]:
-    bodies = _normalize_where_subset(where)
+    return _variables_from_bodies(_normalize_where_subset(where))
+
+
+def _variables_from_bodies(bodies: list[list[tuple[Any, ...]]]) -> list[str]:
     found: set[str] = set()
     for body in bodies:
         for atom in body:
-            for var in _vars_in_atom(atom, include_not_body_vars=False):
-                found.add(var)
+            found.update(_vars_in_atom(atom, include_not_body_vars=False))
     return sorted(found)
 
 
@@ -115,23 +150,25 @@ def query_rel_for_where(where: list[Any]) -> str:
     # 2) Query relation name is fixed to query__<sha256-prefix-8>.
     # 3) Any change here is an incompatible change and must bump protocol/version
     #    (e.g. where_v2 / export_v2 / policy_v2).
-    digest = hashlib.sha256(canonical_where_json_bytes(where)).hexdigest()
-    return f"query__{digest[:8]}"
+    return _query_rel_for_payload(canonical_where_json_bytes(where))
 
 
 def canonical_where_json_bytes(where: list[Any]) -> bytes:
-    return json.dumps(
-        where,
-        ensure_ascii=False,
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
+    return _CANONICAL_ENCODER.encode(where).encode("utf-8")
+
+
+# Keyed on the canonical bytes rather than the where object: where lists are
+# mutable, and True/1 would collide in a tuple-based key.
+@lru_cache(maxsize=1024)
+def _query_rel_for_payload(payload: bytes) -> str:
+    digest = hashlib.sha256(payload).hexdigest()
+    return f"query__{digest[:8]}"
 
 
 def _compile_atom(
     *,
     atom: tuple[Any, ...],
-    pred_arities: dict[str, int],
+    pred_info: dict[str, tuple[int, str, str]],
     pred_type_domains: dict[str, list[str]],
     var_symbols: dict[str, str],
     bound_vars: set[str],
@@ -139,18 +176,20 @@ def _compile_atom(
     in_rel_values: dict[str, tuple[str, ...]],
     query_variables: list[str],
     not_rel_defs: dict[str, tuple[tuple[str, ...], tuple[tuple[str, ...], ...]]],
+    normalized_not_bodies: dict[int, list[list[tuple[Any, ...]]]],
     temporal_view: str,
-    temporal_pred_ids: set[str],
 ) -> str:
     kind = atom[0]
 
     if kind == "pred":
         _, pred_id, terms = atom
-        if pred_id not in pred_arities:
+        info = pred_info.get(pred_id)
+        if info is None:
             raise WhereValidationError(f"unknown predicate in where: {pred_id}")
-        if len(terms) != pred_arities[pred_id]:
+        arity, record_rel, current_rel = info
+        if len(terms) != arity:
             raise WhereValidationError(
-                f"arity mismatch for predicate {pred_id}: expected {pred_arities[pred_id]}, got {len(terms)}"
+                f"arity mismatch for predicate {pred_id}: expected {arity}, got {len(terms)}"
             )
 
         args: list[str] = []
@@ -160,9 +199,7 @@ def _compile_atom(
                 bound_vars.add(term)
             else:
                 args.append(_literal_to_symbol(term))
-        rel_name = normalize_pred_id(pred_id)
-        if temporal_view == "current" and pred_id in temporal_pred_ids:
-            rel_name = f"{rel_name}__current"
+        rel_name = current_rel if temporal_view == "current" else record_rel
         return f'{rel_name}({", ".join(args)})'
 
     if kind == "eq":
@@ -205,7 +242,7 @@ def _compile_atom(
 
         return f"{rel_name}({var_symbols[var]})"
 
-    if kind in {"gt", "ge", "lt", "le"}:
+    if kind in _CMP_OPS:
         _, lhs, rhs = atom
         lhs_is_var = _is_var(lhs)
         rhs_is_var = _is_var(rhs)
@@ -222,49 +259,50 @@ def _compile_atom(
 
         lhs_expr = _compile_cmp_side(lhs, var_symbols, kind)
         rhs_expr = _compile_cmp_side(rhs, var_symbols, kind)
-        op = _cmp_operator(kind)
+        op = _CMP_OPS[kind]
         return f"{lhs_expr} {op} {rhs_expr}"
 
     if kind == "not":
         _, not_body = atom
 
-        not_bodies = _normalize_not_body_subset(not_body)
-        vars_in_not_body: set[str] = set()
+        not_bodies = normalized_not_bodies.get(id(not_body))
+        if not_bodies is None:
+            not_bodies = _normalize_not_body_subset(not_body)
+        branch_var_sets: list[set[str]] = []
         for branch in not_bodies:
+            branch_vars: set[str] = set()
             for not_atom in branch:
-                vars_in_not_body.update(_vars_in_atom(not_atom, include_not_body_vars=True))
+                branch_vars.update(_vars_in_atom(not_atom, include_not_body_vars=True))
+            branch_var_sets.append(branch_vars)
+        vars_in_not_body = set().union(*branch_var_sets)
         if not any(var in bound_vars for var in vars_in_not_body):
             raise WhereValidationError("not body must reference at least one outer bound variable")
 
         key_vars = tuple(var for var in query_variables if var in vars_in_not_body)
         rel_name = _not_rel_name(not_body)
         body_term_groups: list[tuple[str, ...]] = []
-        for branch in not_bodies:
+        for branch, branch_vars in zip(not_bodies, branch_var_sets):
             local_bound_vars = set(bound_vars)
-            branch_terms: list[str] = []
-            branch_vars: set[str] = set()
-            for not_atom in branch:
-                branch_vars.update(_vars_in_atom(not_atom, include_not_body_vars=True))
-                branch_terms.append(
-                    _compile_not_body_atom(
-                        atom=not_atom,
-                        pred_arities=pred_arities,
-                        pred_type_domains=pred_type_domains,
-                        var_symbols=var_symbols,
-                        local_bound_vars=local_bound_vars,
-                        var_type_domains=var_type_domains,
-                        in_rel_values=in_rel_values,
-                        temporal_view=temporal_view,
-                        temporal_pred_ids=temporal_pred_ids,
-                    )
+            branch_terms = tuple(
+                _compile_not_body_atom(
+                    atom=not_atom,
+                    pred_info=pred_info,
+                    pred_type_domains=pred_type_domains,
+                    var_symbols=var_symbols,
+                    local_bound_vars=local_bound_vars,
+                    var_type_domains=var_type_domains,
+                    in_rel_values=in_rel_values,
+                    temporal_view=temporal_view,
                 )
+                for not_atom in branch
+            )
             missing_key_vars = [var for var in key_vars if var not in branch_vars]
             if missing_key_vars:
                 raise WhereValidationError(
                     "not OR branch must reference all correlated variables; missing: "
                     + ", ".join(missing_key_vars)
                 )
-            body_term_groups.append(tuple(branch_terms))
+            body_term_groups.append(branch_terms)
         rel_def = (key_vars, tuple(body_term_groups))
 
         existing = not_rel_defs.get(rel_name)
@@ -281,6 +319,32 @@ def _compile_atom(
     raise WhereValidationError(f"unsupported atom kind: {kind}")
 
 
+def _schema_info(
+    schema_ir: dict,
+) -> tuple[dict[str, list[str]], dict[str, tuple[int, str, str]]]:
+    # Keyed by identity; the cached entry holds schema_ir itself so the id
+    # cannot be reused by another dict while the entry is alive.
+    # The fingerprint covers the predicates' contents, so appending, replacing
+    # or editing predicates of a live schema_ir in place is picked up.
+    fingerprint = schema_predicates_fingerprint(schema_ir)
+    cached = _SCHEMA_INFO_CACHE.get(id(schema_ir))
+    if cached is not None and cached[0] is schema_ir and cached[1] == fingerprint:
+        return cached[2], cached[3]
+
+    pred_type_domains = _schema_pred_type_domains(schema_ir)
+    temporal_pred_ids = _temporal_pred_ids(schema_ir)
+    # pred_id -> (arity, record relation, current-view relation)
+    pred_info: dict[str, tuple[int, str, str]] = {}
+    for pred_id, arg_types in pred_type_domains.items():
+        rel_name = normalize_pred_id(pred_id)
+        current_rel = f"{rel_name}__current" if pred_id in temporal_pred_ids else rel_name
+        pred_info[pred_id] = (len(arg_types), rel_name, current_rel)
+    if len(_SCHEMA_INFO_CACHE) >= _SCHEMA_INFO_CACHE_MAX:
+        _SCHEMA_INFO_CACHE.clear()
+    _SCHEMA_INFO_CACHE[id(schema_ir)] = (schema_ir, fingerprint, pred_type_domains, pred_info)
+    return pred_type_domains, pred_info
+
+
 def _schema_pred_type_domains(schema_ir: dict) -> dict[str, list[str]]:
     predicates = schema_ir.get("predicates")
     if not isinstance(predicates, list):
@@ -327,30 +391,50 @@ def _temporal_pred_ids(schema_ir: dict) -> set[str]:
     return out
 
 
-def _normalize_where_subset(where: Any) -> list[list[tuple[Any, ...]]]:
-    if not isinstance(where, list) or not where:
-        raise WhereValidationError("where must be non-empty list")
+def _normalize_where_subset(
+    where: Any,
+    normalized_not_bodies: dict[int, list[list[tuple[Any, ...]]]] | None = None,
+) -> list[list[tuple[Any, ...]]]:
+    return _normalize_dnf(
+        where,
+        lambda atom: _validate_atom_subset(atom, normalized_not_bodies),
+        label="where",
+        or_label="where OR branch",
+        shape_error="where must be one-level AND or two-level OR-of-AND",
+    )
 
-    if all(_is_atom(item) for item in where):
-        body = [_validate_atom_subset(item) for item in where]
-        if not body:
-            raise WhereValidationError("where body must not be empty")
-        return [body]
 
-    if all(isinstance(item, list) for item in where):
+def _normalize_dnf(
+    value: Any,
+    validate_atom: Callable[[Any], tuple[Any, ...]],
+    *,
+    label: str,
+    or_label: str,
+    shape_error: str,
+) -> list[list[tuple[Any, ...]]]:
+    if not isinstance(value, list) or not value:
+        raise WhereValidationError(f"{label} must be non-empty list")
+
+    if all(_is_atom(item) for item in value):
+        return [[validate_atom(item) for item in value]]
+
+    if all(isinstance(item, list) for item in value):
         bodies: list[list[tuple[Any, ...]]] = []
-        for branch in where:
+        for branch in value:
             if not branch:
-                raise WhereValidationError("where OR branch must not be empty")
+                raise WhereValidationError(f"{or_label} must not be empty")
             if not all(_is_atom(atom) for atom in branch):
-                raise WhereValidationError("where supports at most 2 list levels")
-            bodies.append([_validate_atom_subset(atom) for atom in branch])
+                raise WhereValidationError(f"{label} supports at most 2 list levels")
+            bodies.append([validate_atom(atom) for atom in branch])
         return bodies
 
-    raise WhereValidationError("where must be one-level AND or two-level OR-of-AND")
+    raise WhereValidationError(shape_error)
 
 
-def _validate_atom_subset(atom: Any) -> tuple[Any, ...]:
+def _validate_atom_subset(
+    atom: Any,
+    normalized_not_bodies: dict[int, list[list[tuple[Any, ...]]]] | None = None,
+) -> tuple[Any, ...]:
     if not _is_atom(atom):
         raise WhereValidationError("invalid atom structure")
 
@@ -363,10 +447,17 @@ def _validate_atom_subset(atom: Any) -> tuple[Any, ...]:
             raise WhereValidationError("pred_id must be non-empty string")
         if not isinstance(terms, list) or not terms:
             raise WhereValidationError("pred terms must be non-empty list")
+        # Variable names and pred_ids are interned so the var_symbols and
+        # pred_info lookups during compilation mostly hit on identity.
+        interned_terms: list[Any] = []
         for term in terms:
-            if not _is_var(term) and not _is_literal(term):
+            if _is_var(term):
+                interned_terms.append(_intern(term))
+            elif _is_literal(term):
+                interned_terms.append(term)
+            else:
                 raise WhereValidationError("pred terms must be variables or literals")
-        return atom
+        return (kind, _intern(pred_id), interned_terms)
 
     if kind == "eq":
         if len(atom) != 3:
@@ -394,7 +485,7 @@ def _validate_atom_subset(atom: Any) -> tuple[Any, ...]:
                 raise WhereValidationError("in values must be literals")
         return atom
 
-    if kind in {"gt", "ge", "lt", "le"}:
+    if kind in _CMP_OPS:
         if len(atom) != 3:
             raise WhereValidationError(f"{kind} atom must be ('{kind}', lhs, rhs)")
         _, lhs, rhs = atom
@@ -409,7 +500,9 @@ def _validate_atom_subset(atom: Any) -> tuple[Any, ...]:
         if len(atom) != 2:
             raise WhereValidationError("not atom must be ('not', [pred_atoms...])")
         _, not_body = atom
-        _normalize_not_body_subset(not_body)
+        not_bodies = _normalize_not_body_subset(not_body)
+        if normalized_not_bodies is not None:
+            normalized_not_bodies[id(not_body)] = not_bodies
         return atom
 
     raise WhereValidationError(f"unsupported atom kind: {kind}")
@@ -423,53 +516,32 @@ def _canonicalize_in_values(values: list[Any]) -> tuple[str, ...]:
 
 
 def _normalize_not_body_subset(not_body: Any) -> list[list[tuple[Any, ...]]]:
-    if not isinstance(not_body, list) or not not_body:
-        raise WhereValidationError("not body must be non-empty list")
-
-    allowed_not_kinds = {"pred", "eq", "in", "gt", "ge", "lt", "le"}
-
     def validate_not_atom(not_atom: Any) -> tuple[Any, ...]:
         if not _is_atom(not_atom):
             raise WhereValidationError("not body atoms must be valid atoms")
         not_kind = not_atom[0]
-        if not_kind not in allowed_not_kinds:
+        if not_kind not in _NOT_BODY_KINDS:
             raise WhereValidationError("not body supports pred/eq/in/cmp atoms only")
         return _validate_atom_subset(not_atom)
 
-    if all(_is_atom(item) for item in not_body):
-        body = [validate_not_atom(item) for item in not_body]
-        if not body:
-            raise WhereValidationError("not body must not be empty")
-        return [body]
-
-    if all(isinstance(item, list) for item in not_body):
-        bodies: list[list[tuple[Any, ...]]] = []
-        for branch in not_body:
-            if not branch:
-                raise WhereValidationError("not OR branch must not be empty")
-            if not all(_is_atom(atom) for atom in branch):
-                raise WhereValidationError("not body supports at most 2 list levels")
-            bodies.append([validate_not_atom(atom) for atom in branch])
-        return bodies
-
-    raise WhereValidationError("not body must be AND list or OR-of-AND")
+    return _normalize_dnf(
+        not_body,
+        validate_not_atom,
+        label="not body",
+        or_label="not OR branch",
+        shape_error="not body must be AND list or OR-of-AND",
+    )
 
 
 def _in_rel_name(values: tuple[str, ...]) -> str:
-    payload = json.dumps(list(values), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
-    digest = hashlib.sha256(payload).hexdigest()
-    return f"__in_{digest[:12]}"
+    # values are canonical strings, so the JSON array can be joined directly.
+    payload = f"[{','.join(map(encode_basestring, values))}]".encode("utf-8")
+    return "__in_" + hashlib.blake2b(payload, digest_size=6).hexdigest()
 
 
 def _not_rel_name(not_body: list[tuple[Any, ...]]) -> str:
-    payload = json.dumps(
-        not_body,
-        ensure_ascii=False,
-        separators=(",", ":"),
-        sort_keys=True,
-    ).encode("utf-8")
-    digest = hashlib.sha256(payload).hexdigest()
-    return f"__not_{digest[:12]}"
+    payload = _CANONICAL_ENCODER.encode(not_body).encode("utf-8")
+    return "__not_" + hashlib.blake2b(payload, digest_size=6).hexdigest()
 
 
 def _literal_to_symbol(value: Any) -> str:
@@ -510,7 +582,7 @@ def _assert_cmp_var_allowed(
     domains = var_type_domains.get(var)
     if not domains:
         raise WhereValidationError(f"{kind} variable type unknown: {var}")
-    if any(domain not in {"int", "time"} for domain in domains):
+    if not domains <= _CMP_TYPE_DOMAINS:
         raise WhereValidationError(f"{kind} supports only int/time variables: {var}")
 
 
@@ -526,48 +598,36 @@ def _literal_to_cmp_int_text(value: Any, kind: str) -> str:
     if isinstance(value, int):
         return str(value)
     if isinstance(value, str):
-        if not value or any(ch not in "0123456789-" for ch in value):
-            raise WhereValidationError(f"{kind} literal must be decimal integer")
-        if value.count("-") > 1 or ("-" in value and not value.startswith("-")):
-            raise WhereValidationError(f"{kind} literal must be decimal integer")
-        if value in {"-", ""}:
+        # int() alone would also accept "+1", "1_0", surrounding whitespace and
+        # non-ASCII digits, so check the optional-minus ASCII digit shape first.
+        digits = value[1:] if value.startswith("-") else value
+        if not value.isascii() or not digits.isdigit():
             raise WhereValidationError(f"{kind} literal must be decimal integer")
         return str(int(value))
     raise WhereValidationError(f"{kind} supports only int/time literals")
 
 
-def _cmp_operator(kind: str) -> str:
-    if kind == "gt":
-        return ">"
-    if kind == "ge":
-        return ">="
-    if kind == "lt":
-        return "<"
-    if kind == "le":
-        return "<="
-    raise WhereValidationError(f"unsupported comparison kind: {kind}")
-
-
 def _compile_not_body_atom(
     *,
     atom: tuple[Any, ...],
-    pred_arities: dict[str, int],
+    pred_info: dict[str, tuple[int, str, str]],
     pred_type_domains: dict[str, list[str]],
     var_symbols: dict[str, str],
     local_bound_vars: set[str],
     var_type_domains: dict[str, set[str]],
     in_rel_values: dict[str, tuple[str, ...]],
     temporal_view: str,
-    temporal_pred_ids: set[str],
 ) -> str:
     kind = atom[0]
     if kind == "pred":
         _, pred_id, terms = atom
-        if pred_id not in pred_arities:
+        info = pred_info.get(pred_id)
+        if info is None:
             raise WhereValidationError(f"unknown predicate in where: {pred_id}")
-        if len(terms) != pred_arities[pred_id]:
+        arity, record_rel, current_rel = info
+        if len(terms) != arity:
             raise WhereValidationError(
-                f"arity mismatch for predicate {pred_id}: expected {pred_arities[pred_id]}, got {len(terms)}"
+                f"arity mismatch for predicate {pred_id}: expected {arity}, got {len(terms)}"
             )
 
         args: list[str] = []
@@ -577,9 +637,7 @@ def _compile_not_body_atom(
                 args.append(_symbol_for_var(var_symbols, term))
             else:
                 args.append(_literal_to_symbol(term))
-        rel_name = normalize_pred_id(pred_id)
-        if temporal_view == "current" and pred_id in temporal_pred_ids:
-            rel_name = f"{rel_name}__current"
+        rel_name = current_rel if temporal_view == "current" else record_rel
         return f'{rel_name}({", ".join(args)})'
 
     if kind == "eq":
@@ -620,7 +678,7 @@ def _compile_not_body_atom(
             raise WhereValidationError("in relation name collision detected")
         return f"{rel_name}({_symbol_for_var(var_symbols, var)})"
 
-    if kind in {"gt", "ge", "lt", "le"}:
+    if kind in _CMP_OPS:
         _, lhs, rhs = atom
         lhs_is_var = _is_var(lhs)
         rhs_is_var = _is_var(rhs)
@@ -634,7 +692,7 @@ def _compile_not_body_atom(
             _assert_cmp_var_allowed(rhs, var_type_domains, kind)
         lhs_expr = _compile_cmp_side(lhs, var_symbols, kind)
         rhs_expr = _compile_cmp_side(rhs, var_symbols, kind)
-        op = _cmp_operator(kind)
+        op = _CMP_OPS[kind]
         return f"{lhs_expr} {op} {rhs_expr}"
 
     raise WhereValidationError(f"unsupported atom kind in not body: {kind}")
@@ -651,29 +709,33 @@ def _literal_to_text(value: Any) -> str:
 
 
 def _text_to_symbol(text: str) -> str:
+    # Most symbols need no escaping; the `in` checks are cheaper than copying.
+    if "\\" not in text and '"' not in text and "\n" not in text:
+        return f'"{text}"'
     escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
     return f'"{escaped}"'
 
 
+def _intern(text: str) -> str:
+    return sys.intern(text) if type(text) is str else text
+
+
 def _is_var(value: Any) -> bool:
-    return isinstance(value, str) and len(value) > 1 and value.startswith("$")
+    return isinstance(value, str) and len(value) > 1 and value[0] == "$"
 
 
 def _is_literal(value: Any) -> bool:
-    if isinstance(value, bool):
-        return True
+    # bool is an int subclass, so one isinstance check covers both.
     if isinstance(value, int):
         return True
-    if isinstance(value, str) and not value.startswith("$"):
-        return True
-    return False
+    return isinstance(value, str) and not value.startswith("$")
 
 
 def _is_atom(value: Any) -> bool:
     return isinstance(value, tuple) and len(value) >= 1 and isinstance(value[0], str)
 
 
-def _vars_in_atom(atom: tuple[Any, ...], *, include_not_body_vars: bool) -> list[str]:
+def _vars_in_atom(atom: tuple[Any, ...], *, include_not_body_vars: bool) -> set[str]:
     kind = atom[0]
     found: set[str] = set()
     if kind == "pred":
@@ -691,7 +753,7 @@ def _vars_in_atom(atom: tuple[Any, ...], *, include_not_body_vars: bool) -> list
         _, var, _ = atom
         if _is_var(var):
             found.add(var)
-    elif kind in {"gt", "ge", "lt", "le"}:
+    elif kind in _CMP_OPS:
         _, lhs, rhs = atom
         if _is_var(lhs):
             found.add(lhs)
@@ -701,9 +763,8 @@ def _vars_in_atom(atom: tuple[Any, ...], *, include_not_body_vars: bool) -> list
         if include_not_body_vars:
             _, body = atom
             for not_atom in body:
-                for var in _vars_in_atom(not_atom, include_not_body_vars=True):
-                    found.add(var)
-    return sorted(found)
+                found.update(_vars_in_atom(not_atom, include_not_body_vars=True))
+    return found
 
 
 def _symbol_for_var(var_symbols: dict[str, str], var: str) -> str:
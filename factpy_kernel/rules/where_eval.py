@@ -1,59 +1,102 @@
 from __future__ import annotations
 
-import re
-from typing import Any
+import operator
+from functools import partial
+from typing import Any, Callable
 
 
 class WhereValidationError(Exception):
     pass
 
 
-_DEC_INT_RE = re.compile(r"^-?\d+$")
+_CMP_OPS = {"gt": operator.gt, "ge": operator.ge, "lt": operator.lt, "le": operator.le}
+
+# A compiled atom: maps the envs reaching it to the envs that survive it.
+_Step = Callable[[list[dict[str, Any]]], list[dict[str, Any]]]
+# Pred term layout: literal (idx, value) pairs, var -> positions, repeated-var pairs.
+_PredLayout = tuple[list[tuple[int, Any]], dict[str, list[int]], list[tuple[int, int]]]
+# Pred hash index for one bound-variable set: key values -> facts, plus the
+# (var, position) pairs each match still binds.
+_PredIndex = tuple[dict[tuple[Any, ...], list[tuple[Any, ...]]], list[tuple[str, int]]]
+
+_PLAN_CACHE_MAX = 256
+_PLAN_CACHE: dict[str, list[list[tuple[Any, ...]]]] = {}
 
 
 def evaluate_where(
     view_facts: dict[str, list[tuple[Any, ...]]],
     where: list[Any],
 ) -> list[dict[str, Any]]:
-    bodies = _normalize_where(where)
+    bodies = _cached_plan(where)
 
-    all_bindings: list[dict[str, Any]] = []
-    seen: set[tuple[tuple[str, Any], ...]] = set()
+    bindings_by_key: dict[tuple[tuple[str, Any], ...], dict[str, Any]] = {}
+    # Envs of one body share their key insertion order, so the sorted variable
+    # names are computed once per distinct order rather than once per binding.
+    sorted_vars_by_order: dict[tuple[str, ...], tuple[str, ...]] = {}
 
     for body in bodies:
         body_bindings = _eval_body(view_facts, body)
         for binding in body_bindings:
-            key = tuple(sorted(binding.items(), key=lambda item: item[0]))
-            if key in seen:
-                continue
-            seen.add(key)
-            all_bindings.append(binding)
-
-    all_bindings.sort(key=lambda env: tuple((k, env[k]) for k in sorted(env.keys())))
-    return all_bindings
+            order = tuple(binding)
+            sorted_vars = sorted_vars_by_order.get(order)
+            if sorted_vars is None:
+                sorted_vars = tuple(sorted(order))
+                sorted_vars_by_order[order] = sorted_vars
+            key = tuple([(var, binding[var]) for var in sorted_vars])
+            bindings_by_key.setdefault(key, binding)
+
+    return [bindings_by_key[key] for key in sorted(bindings_by_key)]
+
+
+def _cached_plan(where: Any) -> list[list[tuple[Any, ...]]]:
+    # repr tells tuples from lists and True from 1, which JSON would not.
+    # Normalized bodies share no mutable objects with where, so a cached plan
+    # stays valid if the caller later mutates its where list.
+    key = repr(where)
+    bodies = _PLAN_CACHE.get(key)
+    if bodies is None:
+        bodies = _normalize_where(where)
+        if len(_PLAN_CACHE) >= _PLAN_CACHE_MAX:
+            _PLAN_CACHE.clear()
+        _PLAN_CACHE[key] = bodies
+    return bodies
 
 
 def _normalize_where(where: Any) -> list[list[tuple[Any, ...]]]:
-    if not isinstance(where, list) or not where:
-        raise WhereValidationError("where must be non-empty list")
-
-    if all(_is_atom(item) for item in where):
-        body = [_validate_atom(item) for item in where]
-        if not body:
-            raise WhereValidationError("where body must not be empty")
-        return [body]
-
-    if all(isinstance(item, list) for item in where):
+    return _normalize_dnf(
+        where,
+        _validate_atom,
+        label="where",
+        or_label="where OR branch",
+        shape_error="where must be one-level AND or two-level OR-of-AND",
+    )
+
+
+def _normalize_dnf(
+    value: Any,
+    validate_atom: Callable[[Any], tuple[Any, ...]],
+    *,
+    label: str,
+    or_label: str,
+    shape_error: str,
+) -> list[list[tuple[Any, ...]]]:
+    if not isinstance(value, list) or not value:
+        raise WhereValidationError(f"{label} must be non-empty list")
+
+    if all(_is_atom(item) for item in value):
+        return [[validate_atom(item) for item in value]]
+
+    if all(isinstance(item, list) for item in value):
         bodies: list[list[tuple[Any, ...]]] = []
-        for branch in where:
+        for branch in value:
             if not branch:
-                raise WhereValidationError("where OR branch must not be empty")
+                raise WhereValidationError(f"{or_label} must not be empty")
             if not all(_is_atom(atom) for atom in branch):
-                raise WhereValidationError("where supports at most 2 list levels")
-            bodies.append([_validate_atom(atom) for atom in branch])
+                raise WhereValidationError(f"{label} supports at most 2 list levels")
+            bodies.append([validate_atom(atom) for atom in branch])
         return bodies
 
-    raise WhereValidationError("where must be one-level AND or two-level OR-of-AND")
+    raise WhereValidationError(shape_error)
 
 
 def _validate_atom(atom: Any) -> tuple[Any, ...]:
@@ -72,7 +115,7 @@ def _validate_atom(atom: Any) -> tuple[Any, ...]:
         for term in terms:
             if not _is_var(term) and not _is_literal(term):
                 raise WhereValidationError("pred terms must be variables or literals")
-        return atom
+        return (kind, pred_id, tuple(terms))
 
     if kind == "eq":
         if len(atom) != 3:
@@ -94,9 +137,9 @@ def _validate_atom(atom: Any) -> tuple[Any, ...]:
         for value in values:
             if not _is_literal(value):
                 raise WhereValidationError("in values must be literals")
-        return atom
+        return (kind, var, frozenset(values))
 
-    if kind in {"gt", "ge", "lt", "le"}:
+    if kind in _CMP_OPS:
         if len(atom) != 3:
             raise WhereValidationError(f"{kind} atom must be ('{kind}', lhs, rhs)")
         _, lhs, rhs = atom
@@ -111,8 +154,9 @@ def _validate_atom(atom: Any) -> tuple[Any, ...]:
         if len(atom) != 2:
             raise WhereValidationError("not atom must be ('not', [pred_atoms...])")
         _, not_body = atom
-        _normalize_not_body(not_body)
-        return atom
+        # The normalized branches replace the raw body, so evaluation does not
+        # walk and validate it a second time.
+        return (kind, _normalize_not_body(not_body))
 
     raise WhereValidationError(f"unsupported atom kind: {kind}")
 
@@ -121,88 +165,239 @@ def _eval_body(
     view_facts: dict[str, list[tuple[Any, ...]]],
     body: list[tuple[Any, ...]],
 ) -> list[dict[str, Any]]:
-    envs: list[dict[str, Any]] = [{}]
+    return _run_steps(_compile_steps(view_facts, body, allow_not=True), [{}])
+
+
+def _plan_body(
+    view_facts: dict[str, list[tuple[Any, ...]]],
+    body: list[tuple[Any, ...]],
+) -> list[tuple[Any, ...]]:
+    # An in atom only filters one variable, so it runs right after the atom
+    # that binds it and the joins in between see fewer envs. It is only moved
+    # across pred atoms that cannot raise, so every error surfaces as written
+    # even when the moved filter leaves no env to reach the failing atom.
+    if not any(atom[0] == "in" for atom in body):
+        return body
+    groups: list[list[tuple[Any, ...]]] = []
+    binder_group: dict[str, list[tuple[Any, ...]]] = {}
     for atom in body:
         kind = atom[0]
+        if kind == "in" and atom[1] in binder_group:
+            binder_group[atom[1]].append(atom)
+            continue
+        group = [atom]
+        groups.append(group)
         if kind == "pred":
-            envs = _eval_pred_atom(view_facts, envs, atom)
+            if binder_group and not _pred_cannot_raise(view_facts, atom):
+                binder_group.clear()
+            bound_terms = atom[2]
+        else:
+            binder_group.clear()
+            bound_terms = atom[1:] if kind == "eq" else ()
+        for term in bound_terms:
+            if _is_var(term) and term not in binder_group:
+                binder_group[term] = group
+    return [atom for group in groups for atom in group]
+
+
+def _pred_cannot_raise(
+    view_facts: dict[str, list[tuple[Any, ...]]],
+    atom: tuple[Any, ...],
+) -> bool:
+    _, pred_id, terms = atom
+    facts = view_facts.get(pred_id)
+    if facts is None:
+        return False
+    arity = len(terms)
+    return all(len(fact) == arity for fact in facts)
+
+
+def _compile_steps(
+    view_facts: dict[str, list[tuple[Any, ...]]],
+    body: list[tuple[Any, ...]],
+    *,
+    allow_not: bool,
+) -> list[_Step]:
+    # Atom kinds are dispatched once here; running a body then only calls
+    # the bound steps, which matters for not bodies run once per outer env.
+    steps: list[_Step] = []
+    for atom in _plan_body(view_facts, body):
+        kind = atom[0]
+        if kind == "pred":
+            layout = _pred_term_layout(atom[2])
+            steps.append(
+                partial(_eval_pred_atom, view_facts, atom=atom, layout=layout, indexes={})
+            )
         elif kind == "eq":
-            envs = _eval_eq_atom(envs, atom)
+            steps.append(partial(_eval_eq_atom, atom=atom))
         elif kind == "in":
-            envs = _eval_in_atom(envs, atom)
-        elif kind in {"gt", "ge", "lt", "le"}:
-            envs = _eval_cmp_atom(envs, atom)
-        elif kind == "not":
-            envs = _eval_not_atom(view_facts, envs, atom)
-        else:
+            steps.append(partial(_eval_in_atom, atom=atom))
+        elif kind in _CMP_OPS:
+            steps.append(partial(_eval_cmp_atom, atom=atom))
+        elif kind == "not" and allow_not:
+            steps.append(partial(_eval_not_atom, view_facts, atom=atom))
+        elif allow_not:
             raise WhereValidationError(f"unsupported atom kind: {kind}")
+        else:
+            raise WhereValidationError(f"unsupported atom kind in not body: {kind}")
+    return steps
+
+
+def _run_steps(
+    steps: list[_Step],
+    envs: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    # Envs are never mutated once emitted: atoms that bind copy the env first,
+    # and filter-only atoms pass the surviving env objects through unchanged.
+    for step in steps:
+        envs = step(envs)
         if not envs:
             return []
     return envs
 
 
+def _pred_term_layout(terms: list[Any]) -> _PredLayout:
+    literal_terms: list[tuple[int, Any]] = []
+    var_positions: dict[str, list[int]] = {}
+    for idx, term in enumerate(terms):
+        if _is_var(term):
+            var_positions.setdefault(term, []).append(idx)
+        else:
+            literal_terms.append((idx, term))
+    repeated_pairs = [
+        (positions[0], idx)
+        for positions in var_positions.values()
+        for idx in positions[1:]
+    ]
+    return literal_terms, var_positions, repeated_pairs
+
+
 def _eval_pred_atom(
     view_facts: dict[str, list[tuple[Any, ...]]],
     envs: list[dict[str, Any]],
     atom: tuple[Any, ...],
+    layout: _PredLayout,
+    indexes: dict[tuple[str, ...], _PredIndex],
 ) -> list[dict[str, Any]]:
     _, pred_id, terms = atom
     if pred_id not in view_facts:
         raise WhereValidationError(f"unknown predicate in where: {pred_id}")
 
     facts = view_facts[pred_id]
-    out: list[dict[str, Any]] = []
+    if not envs:
+        return []
 
+    arity = len(terms)
+    literal_terms, var_positions, repeated_pairs = layout
+
+    # Hash join: envs that bind the same variables share one index over the
+    # candidate facts, keyed by the values at those variables' positions.
+    # indexes belongs to the compiled step, so a not branch rerun per outer
+    # env probes the indexes built on its first run instead of rescanning.
+    candidates: list[tuple[Any, ...]] | None = None
+    out: list[dict[str, Any]] = []
     for env in envs:
-        for fact in facts:
-            if len(fact) != len(terms):
-                raise WhereValidationError(
-                    f"arity mismatch for predicate {pred_id}: expected {len(terms)}, got {len(fact)}"
-                )
-            next_env = dict(env)
-            ok = True
-            for term, value in zip(terms, fact):
-                if _is_var(term):
-                    bound = next_env.get(term)
-                    if bound is None:
-                        next_env[term] = value
-                    elif bound != value:
-                        ok = False
-                        break
-                else:
-                    if term != value:
-                        ok = False
-                        break
-            if ok:
-                out.append(next_env)
+        bound_vars = tuple(var for var in var_positions if env.get(var) is not None)
+        entry = indexes.get(bound_vars)
+        if entry is None:
+            if candidates is None:
+                # One pass checks arity and applies the env-independent filters.
+                candidates = []
+                for fact in facts:
+                    if len(fact) != arity:
+                        raise WhereValidationError(
+                            f"arity mismatch for predicate {pred_id}: "
+                            f"expected {arity}, got {len(fact)}"
+                        )
+                    if literal_terms and not all(
+                        fact[idx] == term for idx, term in literal_terms
+                    ):
+                        continue
+                    if repeated_pairs and not all(
+                        fact[first] == fact[idx] for first, idx in repeated_pairs
+                    ):
+                        continue
+                    candidates.append(fact)
+                candidates = _dedup_facts(candidates)
+            key_positions = [var_positions[var][0] for var in bound_vars]
+            index: dict[tuple[Any, ...], list[tuple[Any, ...]]] = {}
+            for fact in candidates:
+                index.setdefault(tuple([fact[idx] for idx in key_positions]), []).append(fact)
+            unbound = [
+                (var, positions[0])
+                for var, positions in var_positions.items()
+                if var not in bound_vars
+            ]
+            entry = (index, unbound)
+            indexes[bound_vars] = entry
+
+        index, unbound = entry
+        matches = index.get(tuple([env[var] for var in bound_vars]))
+        if not matches:
+            continue
+        if not unbound:
+            # Nothing new to bind: the pred only filters, so reuse the env.
+            out.extend([env] * len(matches))
+            continue
+        for fact in matches:
+            next_env = env.copy()
+            for var, idx in unbound:
+                next_env[var] = fact[idx]
+            out.append(next_env)
 
     return out
 
 
+def _dedup_facts(facts: list[tuple[Any, ...]]) -> list[tuple[Any, ...]]:
+    # Duplicate facts only multiply envs that evaluate_where dedups at the end.
+    # Equal facts are kept apart when their value types differ (1 vs True),
+    # since cmp atoms treat those differently.
+    variants_by_fact: dict[tuple[Any, ...], list[tuple[Any, ...]]] = {}
+    unique: list[tuple[Any, ...]] = []
+    for fact in facts:
+        variants = variants_by_fact.get(fact)
+        if variants is None:
+            variants_by_fact[fact] = [fact]
+        elif any(all(map(_same_type, fact, variant)) for variant in variants):
+            continue
+        else:
+            variants.append(fact)
+        unique.append(fact)
+    return unique
+
+
+def _same_type(left: Any, right: Any) -> bool:
+    return type(left) is type(right)
+
+
 def _eval_eq_atom(
     envs: list[dict[str, Any]],
     atom: tuple[Any, ...],
 ) -> list[dict[str, Any]]:
     _, lhs, rhs = atom
+    lhs_is_var = _is_var(lhs)
+    rhs_is_var = _is_var(rhs)
     out: list[dict[str, Any]] = []
 
     for env in envs:
-        lhs_known, lhs_value = _resolve(env, lhs)
-        rhs_known, rhs_value = _resolve(env, rhs)
+        lhs_known = not lhs_is_var or lhs in env
+        rhs_known = not rhs_is_var or rhs in env
+        lhs_value = env[lhs] if lhs_is_var and lhs_known else lhs
+        rhs_value = env[rhs] if rhs_is_var and rhs_known else rhs
 
         if lhs_known and rhs_known:
             if lhs_value == rhs_value:
-                out.append(dict(env))
+                out.append(env)
             continue
 
-        if lhs_known and _is_var(rhs):
-            next_env = dict(env)
+        if lhs_known and rhs_is_var:
+            next_env = env.copy()
             next_env[rhs] = lhs_value
             out.append(next_env)
             continue
 
-        if rhs_known and _is_var(lhs):
-            next_env = dict(env)
+        if rhs_known and lhs_is_var:
+            next_env = env.copy()
             next_env[lhs] = rhs_value
             out.append(next_env)
             continue
@@ -216,15 +411,14 @@ def _eval_in_atom(
     envs: list[dict[str, Any]],
     atom: tuple[Any, ...],
 ) -> list[dict[str, Any]]:
-    _, var, values = atom
-    allowed = set(values)
+    _, var, allowed = atom
 
     out: list[dict[str, Any]] = []
     for env in envs:
         if var not in env:
             raise WhereValidationError(f"in variable must be bound before filter: {var}")
         if env[var] in allowed:
-            out.append(dict(env))
+            out.append(env)
     return out
 
 
@@ -233,24 +427,25 @@ def _eval_cmp_atom(
     atom: tuple[Any, ...],
 ) -> list[dict[str, Any]]:
     kind, lhs, rhs = atom
+    holds = _CMP_OPS.get(kind)
+    if holds is None:
+        raise WhereValidationError(f"unsupported comparison kind: {kind}")
+    lhs_is_var = _is_var(lhs)
+    rhs_is_var = _is_var(rhs)
     out: list[dict[str, Any]] = []
 
     for env in envs:
-        lhs_known, lhs_value_raw = _resolve(env, lhs)
-        rhs_known, rhs_value_raw = _resolve(env, rhs)
-
-        if not lhs_known and _is_var(lhs):
+        # Literal sides are always resolvable, so only variables can be missing.
+        if lhs_is_var and lhs not in env:
             raise WhereValidationError(f"{kind} variable must be bound before filter: {lhs}")
-        if not rhs_known and _is_var(rhs):
+        if rhs_is_var and rhs not in env:
             raise WhereValidationError(f"{kind} variable must be bound before filter: {rhs}")
-        if not lhs_known or not rhs_known:
-            raise WhereValidationError(f"{kind} requires both sides to be resolvable")
 
-        lhs_value = _coerce_cmp_int(lhs_value_raw, kind)
-        rhs_value = _coerce_cmp_int(rhs_value_raw, kind)
+        lhs_value = _coerce_cmp_int(env[lhs] if lhs_is_var else lhs, kind)
+        rhs_value = _coerce_cmp_int(env[rhs] if rhs_is_var else rhs, kind)
 
-        if _cmp_holds(kind, lhs_value, rhs_value):
-            out.append(dict(env))
+        if holds(lhs_value, rhs_value):
+            out.append(env)
 
     return out
 
@@ -260,9 +455,16 @@ def _eval_not_atom(
     envs: list[dict[str, Any]],
     atom: tuple[Any, ...],
 ) -> list[dict[str, Any]]:
-    _, not_body = atom
-    not_branches = _normalize_not_body(not_body)
+    _, not_branches = atom
     vars_in_not_body = _vars_in_not_bodies(not_branches)
+    not_steps = [
+        _compile_steps(view_facts, branch, allow_not=False) for branch in not_branches
+    ]
+    # Semi-join: a branch that runs without outer bindings is evaluated once,
+    # and envs are probed against its rows projected on the correlated vars.
+    standalone = [_is_standalone_branch(branch) for branch in not_branches]
+    branch_rows: list[list[dict[str, Any]] | None] = [None] * len(not_branches)
+    semi_keys: dict[tuple[int, tuple[str, ...]], set[tuple[Any, ...]]] = {}
 
     out: list[dict[str, Any]] = []
     for env in envs:
@@ -270,7 +472,7 @@ def _eval_not_atom(
             raise WhereValidationError(
                 "not body must reference at least one outer bound variable"
             )
-        correlated_vars = sorted(var for var in vars_in_not_body if var in env)
+        correlated_vars = tuple(sorted(var for var in vars_in_not_body if var in env))
         if len(not_branches) > 1 and correlated_vars:
             for branch in not_branches:
                 branch_vars = set(_vars_in_atoms(branch))
@@ -280,35 +482,47 @@ def _eval_not_atom(
                         "not OR branch must reference all correlated variables; missing: "
                         + ", ".join(missing)
                     )
-        if not _exists_not_body(view_facts, env, not_branches):
-            out.append(dict(env))
-    return out
-
 
-def _exists_not_body(
-    view_facts: dict[str, list[tuple[Any, ...]]],
-    env: dict[str, Any],
-    bodies: list[list[tuple[Any, ...]]],
-) -> bool:
-    for body in bodies:
-        envs: list[dict[str, Any]] = [dict(env)]
-        for atom in body:
-            kind = atom[0]
-            if kind == "pred":
-                envs = _eval_pred_atom(view_facts, envs, atom)
-            elif kind == "eq":
-                envs = _eval_eq_atom(envs, atom)
-            elif kind == "in":
-                envs = _eval_in_atom(envs, atom)
-            elif kind in {"gt", "ge", "lt", "le"}:
-                envs = _eval_cmp_atom(envs, atom)
+        exists = False
+        for branch_idx, steps in enumerate(not_steps):
+            if not standalone[branch_idx]:
+                exists = bool(_run_steps(steps, [env]))
             else:
-                raise WhereValidationError(f"unsupported atom kind in not body: {kind}")
-            if not envs:
+                keys = semi_keys.get((branch_idx, correlated_vars))
+                if keys is None:
+                    rows = branch_rows[branch_idx]
+                    if rows is None:
+                        rows = _run_steps(steps, [{}])
+                        branch_rows[branch_idx] = rows
+                    keys = {tuple([row[var] for var in correlated_vars]) for row in rows}
+                    semi_keys[(branch_idx, correlated_vars)] = keys
+                exists = tuple([env[var] for var in correlated_vars]) in keys
+            if exists:
                 break
-        if envs:
-            return True
-    return False
+        if not exists:
+            out.append(env)
+    return out
+
+
+def _is_standalone_branch(branch: list[tuple[Any, ...]]) -> bool:
+    # cmp atoms are left correlated: their int coercion can raise, and only
+    # rows matching an outer env may reach them.
+    bound: set[str] = set()
+    for atom in branch:
+        kind = atom[0]
+        if kind == "pred":
+            bound.update(term for term in atom[2] if _is_var(term))
+        elif kind == "eq":
+            sides = atom[1:]
+            if all(_is_var(side) and side not in bound for side in sides):
+                return False
+            bound.update(side for side in sides if _is_var(side))
+        elif kind == "in":
+            if atom[1] not in bound:
+                return False
+        else:
+            return False
+    return True
 
 
 def _coerce_cmp_int(value: Any, kind: str) -> int:
@@ -317,44 +531,23 @@ def _coerce_cmp_int(value: Any, kind: str) -> int:
     if isinstance(value, int):
         return value
     if isinstance(value, str):
-        if not _DEC_INT_RE.fullmatch(value):
+        # isdecimal accepts exactly the characters \d does, without a regex call.
+        digits = value[1:] if value.startswith("-") else value
+        if not digits.isdecimal():
             raise WhereValidationError(f"{kind} supports only int/time decimal values")
         return int(value)
     raise WhereValidationError(f"{kind} supports only int/time values")
 
 
-def _cmp_holds(kind: str, lhs: int, rhs: int) -> bool:
-    if kind == "gt":
-        return lhs > rhs
-    if kind == "ge":
-        return lhs >= rhs
-    if kind == "lt":
-        return lhs < rhs
-    if kind == "le":
-        return lhs <= rhs
-    raise WhereValidationError(f"unsupported comparison kind: {kind}")
-
-
-def _resolve(env: dict[str, Any], term: Any) -> tuple[bool, Any]:
-    if _is_var(term):
-        if term in env:
-            return True, env[term]
-        return False, None
-    return True, term
-
-
 def _is_var(value: Any) -> bool:
-    return isinstance(value, str) and len(value) > 1 and value.startswith("$")
+    return isinstance(value, str) and len(value) > 1 and value[0] == "$"
 
 
 def _is_literal(value: Any) -> bool:
-    if isinstance(value, bool):
-        return True
+    # bool is an int subclass, so one isinstance check covers both.
     if isinstance(value, int):
         return True
-    if isinstance(value, str) and not value.startswith("$"):
-        return True
-    return False
+    return isinstance(value, str) and not value.startswith("$")
 
 
 def _is_atom(value: Any) -> bool:
@@ -380,7 +573,7 @@ def _vars_in_atoms(body: list[tuple[Any, ...]]) -> list[str]:
             _, var, _ = atom
             if _is_var(var):
                 found.add(var)
-        elif kind in {"gt", "ge", "lt", "le"}:
+        elif kind in _CMP_OPS:
             _, lhs, rhs = atom
             if _is_var(lhs):
                 found.add(lhs)
@@ -398,9 +591,6 @@ def _vars_in_not_bodies(bodies: list[list[tuple[Any, ...]]]) -> list[str]:
 
 
 def _normalize_not_body(not_body: Any) -> list[list[tuple[Any, ...]]]:
-    if not isinstance(not_body, list) or not not_body:
-        raise WhereValidationError("not body must be non-empty list")
-
     allowed_not_kinds = {"pred", "eq", "in", "gt", "ge", "lt", "le"}
 
     def validate_not_atom(not_atom: Any) -> tuple[Any, ...]:
@@ -411,20 +601,10 @@ def _normalize_not_body(not_body: Any) -> list[list[tuple[Any, ...]]]:
             raise WhereValidationError("not body supports pred/eq/in/cmp atoms only")
         return _validate_atom(not_atom)
 
-    if all(_is_atom(item) for item in not_body):
-        body = [validate_not_atom(item) for item in not_body]
-        if not body:
-            raise WhereValidationError("not body must not be empty")
-        return [body]
-
-    if all(isinstance(item, list) for item in not_body):
-        bodies: list[list[tuple[Any, ...]]] = []
-        for branch in not_body:
-            if not branch:
-                raise WhereValidationError("not OR branch must not be empty")
-            if not all(_is_atom(atom) for atom in branch):
-                raise WhereValidationError("not body supports at most 2 list levels")
-            bodies.append([validate_not_atom(atom) for atom in branch])
-        return bodies
-
-    raise WhereValidationError("not body must be AND list or OR-of-AND")
+    return _normalize_dnf(
+        not_body,
+        validate_not_atom,
+        label="not body",
+        or_label="not OR branch",
+        shape_error="not body must be AND list or OR-of-AND",
+    )
@@ -6,9 +6,11 @@ import json
 import os
 import shutil
 import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 from factpy_kernel.export.pred_norm import normalize_pred_id
 from factpy_kernel.export.tsv_v1 import tsv_cell_v1_decode, write_tsv
@@ -18,6 +20,10 @@ class RunnerCapabilityError(Exception):
     pass
 
 
+_DIGEST_CHUNK_SIZE = 1 << 20
+_ENGINE_LOG_LIMIT = 64 * 1024
+
+
 def find_souffle_binary() -> Path | None:
     env_value = os.getenv("SOUFFLE_BIN")
     if env_value is not None:
@@ -77,21 +83,26 @@ def run_package(
             try:
                 program_path = _build_program_file(pkg_dir, manifest, work_dir)
                 if program_path.read_text(encoding="utf-8").strip():
-                    proc = subprocess.run(
-                        [
-                            str(souffle_bin_path),
-                            "-F",
-                            str(pkg_dir / "facts"),
-                            "-D",
-                            str(raw_dir),
-                            str(program_path),
-                        ],
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                    )
-                    engine_stdout = proc.stdout
-                    engine_stderr = proc.stderr
+                    # Engine streams go straight to log files instead of being
+                    # buffered in memory; the manifest keeps a bounded excerpt.
+                    stdout_path = work_dir / "engine_stdout.log"
+                    stderr_path = work_dir / "engine_stderr.log"
+                    with stdout_path.open("wb") as stdout_f, stderr_path.open("wb") as stderr_f:
+                        proc = subprocess.run(
+                            [
+                                str(souffle_bin_path),
+                                "-F",
+                                str(pkg_dir / "facts"),
+                                "-D",
+                                str(raw_dir),
+                                str(program_path),
+                            ],
+                            stdout=stdout_f,
+                            stderr=stderr_f,
+                            check=False,
+                        )
+                    engine_stdout = _read_engine_log(stdout_path)
+                    engine_stderr = _read_engine_log(stderr_path)
                     exit_code = proc.returncode
                 if exit_code == 0:
                     _convert_raw_outputs(raw_dir, outputs_dir)
@@ -139,22 +150,46 @@ def run_package(
 
 
 def _prepare_output_workspace(outputs_dir: Path) -> tuple[Path, Path]:
-    for out_file in outputs_dir.glob("*.out.facts"):
-        out_file.unlink()
+    with os.scandir(outputs_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".out.facts"):
+                os.unlink(entry.path)
+            elif entry.name.startswith((".raw.trash.", ".work.trash.")):
+                # Left behind when an earlier background delete did not finish.
+                _discard_dir(Path(entry.path), rename=False)
 
     raw_dir = outputs_dir / ".raw"
     work_dir = outputs_dir / ".work"
 
     if raw_dir.exists():
-        shutil.rmtree(raw_dir)
+        _discard_dir(raw_dir)
     if work_dir.exists():
-        shutil.rmtree(work_dir)
+        _discard_dir(work_dir)
 
     raw_dir.mkdir(parents=True, exist_ok=True)
     work_dir.mkdir(parents=True, exist_ok=True)
     return raw_dir, work_dir
 
 
+def _discard_dir(path: Path, *, rename: bool = True) -> None:
+    # Renaming is a single syscall, so the fresh workspace can be created at
+    # once; the old tree is deleted off the hot path.
+    trash = path
+    if rename:
+        trash = path.with_name(f"{path.name}.trash.{uuid4().hex}")
+        try:
+            path.rename(trash)
+        except OSError:
+            shutil.rmtree(path)
+            return
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(trash,),
+        kwargs={"ignore_errors": True},
+        daemon=True,
+    ).start()
+
+
 def _resolve_entrypoints(entrypoints: list[str], manifest: dict[str, Any]) -> list[str]:
     resolved = list(entrypoints)
     if not resolved:
@@ -235,15 +270,18 @@ def _convert_raw_outputs(raw_dir: Path, outputs_dir: Path) -> None:
         if raw_path.suffix not in {".csv", ".facts"}:
             continue
 
-        rows: list[list[str]] = []
-        with raw_path.open("r", encoding="utf-8") as f:
-            for raw_line in f:
-                line = raw_line.rstrip("\n")
-                if line == "":
-                    continue
-                rows.append(_parse_souffle_line(line, raw_path.name))
+        data = raw_path.read_text(encoding="utf-8")
+        if "," not in data and '"' not in data and "\\" not in data:
+            # Plain tab-separated output: no line can need the CSV reader.
+            rows = [line.split("\t") for line in data.split("\n") if line]
+        else:
+            rows = [
+                _parse_souffle_line(line, raw_path.name)
+                for line in data.split("\n")
+                if line
+            ]
 
-        rows.sort(key=lambda row: tuple(row))
+        rows.sort()
         out_path = outputs_dir / f"{raw_path.stem}.out.facts"
         write_tsv(out_path, rows)
 
@@ -324,13 +362,16 @@ def _manifest_path(manifest: dict[str, Any], *keys: str) -> str:
 
 def _validate_facts_tsv(facts_dir: Path) -> None:
     for facts_path in sorted(facts_dir.glob("*.facts")):
-        with facts_path.open("r", encoding="utf-8") as f:
-            for raw_line in f:
-                line = raw_line.rstrip("\n")
-                if line == "":
-                    continue
-                for cell in line.split("\t"):
-                    tsv_cell_v1_decode(cell)
+        data = facts_path.read_text(encoding="utf-8")
+        # Decoding can only fail on an escape, so cells are decoded only on
+        # lines that contain a backslash.
+        if "\\" not in data:
+            continue
+        for line in data.split("\n"):
+            if "\\" not in line:
+                continue
+            for cell in line.split("\t"):
+                tsv_cell_v1_decode(cell)
 
 
 def _compute_outputs_digest(package_dir: Path) -> str:
@@ -341,15 +382,30 @@ def _compute_outputs_digest(package_dir: Path) -> str:
     )
 
     hasher = hashlib.sha256()
+    # Files are streamed through one reused buffer so large outputs are never
+    # held in memory whole; the hashed byte sequence is unchanged.
+    buf = bytearray(_DIGEST_CHUNK_SIZE)
+    view = memoryview(buf)
     for path in out_files:
         rel = path.relative_to(package_dir).as_posix().encode("utf-8")
-        payload = path.read_bytes()
         hasher.update(rel)
         hasher.update(b"\x00")
-        hasher.update(payload)
+        with path.open("rb", buffering=0) as f:
+            while n := f.readinto(buf):
+                hasher.update(view[:n])
     return f"sha256:{hasher.hexdigest()}"
 
 
+def _read_engine_log(path: Path) -> str:
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        data = f.read(_ENGINE_LOG_LIMIT)
+    text = data.decode("utf-8", errors="replace")
+    if size > _ENGINE_LOG_LIMIT:
+        text += f"\n[truncated: {size - _ENGINE_LOG_LIMIT} more bytes in {path.name}]"
+    return text
+
+
 def _append_error(existing: str, extra: str) -> str:
     if not existing:
         return extra
@@ -29,6 +29,14 @@ REQUIRED_TOP_LEVEL_KEYS = (
 
 REQUIRED_PROTOCOL_KEYS = ("idref_v1", "tup_v1", "export_v1")
 
+_REQUIRED_TOP_LEVEL_KEY_SET = frozenset(REQUIRED_TOP_LEVEL_KEYS)
+
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+)
+
 
 class SchemaIRValidationError(Exception):
     pass
@@ -62,14 +70,9 @@ def ensure_schema_ir(schema_ir: dict) -> dict:
 
 def canonicalize_schema_ir_jcs(schema_ir: dict) -> bytes:
     validated = ensure_schema_ir(schema_ir)
-    _reject_floats(validated, "$")
+    _reject_floats(validated)
     try:
-        return json.dumps(
-            validated,
-            sort_keys=True,
-            separators=(",", ":"),
-            ensure_ascii=False,
-        ).encode("utf-8")
+        return _CANONICAL_ENCODER.encode(validated).encode("utf-8")
     except (TypeError, ValueError) as exc:
         raise SchemaIRValidationError(f"failed to canonicalize schema_ir: {exc}") from exc
 
@@ -79,13 +82,18 @@ def schema_digest(schema_ir: dict) -> str:
     return sha256_token(canonical)
 
 
+def schema_predicates_fingerprint(schema_ir: dict) -> str:
+    # repr keeps dict/list, tuple/list and True/1 apart, so two JSON-shaped
+    # schemas share a fingerprint only if their predicates are equal.
+    return repr(schema_ir.get("predicates"))
+
+
 def _validate_top_level(schema_ir: dict) -> None:
-    keys = set(schema_ir.keys())
-    required = set(REQUIRED_TOP_LEVEL_KEYS)
-    missing = [key for key in REQUIRED_TOP_LEVEL_KEYS if key not in keys]
-    if missing:
+    keys = schema_ir.keys()
+    if _REQUIRED_TOP_LEVEL_KEY_SET - keys:
+        missing = [key for key in REQUIRED_TOP_LEVEL_KEYS if key not in keys]
         raise SchemaIRValidationError(f"missing top-level keys: {missing}")
-    extra = sorted(keys - required)
+    extra = sorted(keys - _REQUIRED_TOP_LEVEL_KEY_SET)
     if extra:
         raise SchemaIRValidationError(
             f"unexpected top-level keys: {extra}; top-level structure is canonical"
@@ -248,7 +256,23 @@ def _validate_record_exists_constraint(
             )
 
 
-def _reject_floats(value: Any, path: str) -> None:
+def _reject_floats(root: Any) -> None:
+    stack = [root]
+    pop = stack.pop
+    while stack:
+        value = pop()
+        if isinstance(value, dict):
+            for key in value:
+                if not isinstance(key, str):
+                    _raise_non_canonical_at(root, "$")
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, float):
+            _raise_non_canonical_at(root, "$")
+
+
+def _raise_non_canonical_at(value: Any, path: str) -> None:
     if isinstance(value, float):
         raise SchemaIRValidationError(f"float is not allowed in schema_ir at {path}")
     if isinstance(value, dict):
@@ -257,7 +281,7 @@ def _reject_floats(value: Any, path: str) -> None:
                 raise SchemaIRValidationError(
                     f"schema_ir object key must be string at {path}"
                 )
-            _reject_floats(child, f"{path}.{key}")
+            _raise_non_canonical_at(child, f"{path}.{key}")
     elif isinstance(value, list):
         for index, child in enumerate(value):
-            _reject_floats(child, f"{path}[{index}]")
+            _raise_non_canonical_at(child, f"{path}[{index}]")
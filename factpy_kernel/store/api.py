@@ -334,6 +334,8 @@ class Store:
     ) -> list[CandidateSet]:
         run_id = uuid4().hex
         group_key_indexes = self._read_group_key_indexes(schema_pred, len(arg_specs))
+        if group_key_indexes and group_key_indexes[0] == 0:
+            group_key_indexes = group_key_indexes[1:]
 
         candidates: list[CandidateSet] = []
         for binding in bindings:
@@ -349,11 +351,7 @@ class Store:
             except ValueError as exc:
                 raise WhereValidationError(f"invalid rest_terms for target payload: {exc}") from exc
 
-            dims_terms: list[tuple[str, Any]] = []
-            for idx in group_key_indexes:
-                if idx == 0:
-                    continue
-                dims_terms.append(tagged_args[idx])
+            dims_terms = [tagged_args[idx] for idx in group_key_indexes]
 
             key_terms = [("string", target_pred_id), ("entity_ref", e_ref), *dims_terms]
             tup_digest = sha256_token(canonical_bytes_tup_v1(rest_terms))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from bisect import insort
 from dataclasses import dataclass
 from typing import Any
 
@@ -44,7 +46,14 @@ class Ledger:
         self._meta_rows: list[MetaRow] = []
         self._revokes: list[Revokes] = []
         self._claim_by_asrt_id: dict[str, Claim] = {}
+        self._claim_args_by_asrt_id: dict[str, list[ClaimArg]] = {}
         self._revoker_asrt_ids: set[str] = set()
+        self._revoked_asrt_ids: set[str] = set()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     @property
     def claims(self) -> list[Claim]:
@@ -75,14 +84,17 @@ class Ledger:
             raise ValueError("e_ref must be non-empty")
 
         normalized_rest_terms = [self._normalize_term(term) for term in claim.rest_terms]
+        # pred_id and e_ref are interned: they are the join and lookup keys of
+        # every projected view, so equal values then compare by identity.
         normalized_claim = Claim(
             asrt_id=claim.asrt_id,
-            pred_id=claim.pred_id,
-            e_ref=claim.e_ref,
+            pred_id=_intern_str(claim.pred_id),
+            e_ref=_intern_str(claim.e_ref),
             rest_terms=normalized_rest_terms,
         )
         self._claims.append(normalized_claim)
         self._claim_by_asrt_id[normalized_claim.asrt_id] = normalized_claim
+        self._version += 1
 
     def append_claim_args(self, rows: list[ClaimArg]) -> None:
         for row in rows:
@@ -94,7 +106,20 @@ class Ledger:
                 raise ValueError("claim_arg idx must be non-negative int")
             if not isinstance(row.tag, str) or not row.tag:
                 raise ValueError("claim_arg tag must be non-empty str")
+            if row.tag == "entity_ref":
+                row = ClaimArg(
+                    asrt_id=row.asrt_id,
+                    idx=row.idx,
+                    val_atom=_intern_str(row.val_atom),
+                    tag=row.tag,
+                )
             self._claim_args.append(row)
+            insort(
+                self._claim_args_by_asrt_id.setdefault(row.asrt_id, []),
+                row,
+                key=lambda item: item.idx,
+            )
+            self._version += 1
 
     def append_meta(self, rows: list[MetaRow]) -> None:
         for row in rows:
@@ -107,6 +132,7 @@ class Ledger:
             if not isinstance(row.key, str) or not row.key:
                 raise ValueError("meta key must be non-empty str")
             self._meta_rows.append(row)
+            self._version += 1
 
     def append_revokes(self, row: Revokes) -> None:
         if not isinstance(row, Revokes):
@@ -114,7 +140,9 @@ class Ledger:
         if not row.revoker_asrt_id or not row.revoked_asrt_id:
             raise ValueError("revoker_asrt_id and revoked_asrt_id must be non-empty")
         self._revoker_asrt_ids.add(row.revoker_asrt_id)
+        self._revoked_asrt_ids.add(row.revoked_asrt_id)
         self._revokes.append(row)
+        self._version += 1
 
     def find_claims(
         self, pred_id: str | None = None, e_ref: str | None = None
@@ -127,11 +155,17 @@ class Ledger:
         return list(rows)
 
     def has_active_revocation(self, revoked_asrt_id: str) -> bool:
-        return any(row.revoked_asrt_id == revoked_asrt_id for row in self._revokes)
+        return revoked_asrt_id in self._revoked_asrt_ids
+
+    def active_asrt_id_set(self) -> set[str]:
+        return self._claim_by_asrt_id.keys() - self._revoked_asrt_ids
 
     def get_claim(self, asrt_id: str) -> Claim | None:
         return self._claim_by_asrt_id.get(asrt_id)
 
+    def claim_args_for(self, asrt_id: str) -> list[ClaimArg]:
+        return list(self._claim_args_by_asrt_id.get(asrt_id, ()))
+
     def find_meta(
         self,
         asrt_id: str | None = None,
@@ -164,3 +198,7 @@ class Ledger:
         if not isinstance(tag, str) or not tag:
             raise ValueError("rest_terms tag must be non-empty str")
         return tag, value
+
+
+def _intern_str(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import tempfile
 import unittest
@@ -353,6 +354,18 @@ class AuditExportV1Tests(unittest.TestCase):
         self.assertEqual([row["event_kind"] for row in edb_decision_rows], ["mapping_decision"])
         self.assertEqual([row["event_source"] for row in edb_decision_rows], ["mapping"])
         self.assertEqual(edb_decision_rows[0]["event_ts"], 200)
+        expected_key_hash = hashlib.sha256(
+            json.dumps(
+                {"key_tuple": [mention]},
+                ensure_ascii=False,
+                sort_keys=True,
+                separators=(",", ":"),
+            ).encode("utf-8")
+        ).hexdigest()[:12]
+        self.assertEqual(
+            edb_decision_rows[0]["decision_id"],
+            f"mapping_decision:er:canon_of:{expected_key_hash}",
+        )
         self.assertEqual([row["error_class"] for row in idb_accept_failed_rows], ["mapping_error"])
         self.assertEqual([row["event_kind"] for row in idb_accept_failed_rows], ["mapping_error"])
         self.assertEqual([row["event_source"] for row in idb_accept_failed_rows], ["mapping"])
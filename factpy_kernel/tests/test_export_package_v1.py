@@ -87,6 +87,8 @@ class ExportPackageV1Tests(unittest.TestCase):
             normalized = normalize_pred_id("person:country")
             self.assertEqual(normalized, "p_person_country")
             self.assertEqual(denormalize_engine_pred(normalized), "person:country")
+            for pred_id in ["er:canon_of", "a__b:c", "x-y:z.w", "ns:h2_h41_"]:
+                self.assertEqual(denormalize_engine_pred(normalize_pred_id(pred_id)), pred_id)
 
     def test_export_digests_stable_across_directories(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
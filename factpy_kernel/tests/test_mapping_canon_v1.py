@@ -3,7 +3,7 @@ from __future__ import annotations
 import unittest
 
 from factpy_kernel.evidence.write_protocol import set_field
-from factpy_kernel.mapping.canon import MappingConflictError
+from factpy_kernel.mapping.canon import MappingConflictError, MappingResolveError
 from factpy_kernel.store.api import Store
 from factpy_kernel.store.ledger import MetaRow
 
@@ -93,6 +93,56 @@ class MappingCanonV1Tests(unittest.TestCase):
         resolution = store.resolve_mapping("er:canon_of", policy_mode="edb")
         self.assertEqual(resolution.chosen_map[(mention,)], (canon_crm,))
 
+    def test_mapping_prefer_source_ignores_private_looking_config_keys(self) -> None:
+        store = Store(
+            schema_ir=_schema_with_mapping(
+                tie_break={"mode": "prefer_source", "_source_order": {"crm": 0}}
+            )
+        )
+        mention = "idref_v1:Person:m3"
+        canon_hr = "idref_v1:Person:c_hr"
+        canon_crm = "idref_v1:Person:c_crm"
+
+        for canon, source in ((canon_hr, "hr"), (canon_crm, "crm")):
+            set_field(
+                store.ledger,
+                pred_id="er:canon_of",
+                e_ref=mention,
+                rest_terms=[("entity_ref", canon)],
+                meta={"source": source, "source_loc": f"row-{source}"},
+            )
+
+        with self.assertRaisesRegex(MappingResolveError, "source_rank"):
+            store.resolve_mapping("er:canon_of", policy_mode="edb")
+
+    def test_mapping_max_confidence_tie_uses_latest(self) -> None:
+        store = Store(schema_ir=_schema_with_mapping(tie_break="max_confidence"))
+        mention = "idref_v1:Person:m4"
+        asrt_ids = []
+        for idx, (canon, confidence, ingested_at) in enumerate(
+            [
+                ("idref_v1:Person:c_low", 1, 900),
+                ("idref_v1:Person:c_old", 5, 100),
+                ("idref_v1:Person:c_new", 5, 200),
+            ]
+        ):
+            asrt_id = set_field(
+                store.ledger,
+                pred_id="er:canon_of",
+                e_ref=mention,
+                rest_terms=[("entity_ref", canon)],
+                meta={"source": "hr", "source_loc": f"row-{idx}"},
+            )
+            store.ledger.append_meta(
+                [MetaRow(asrt_id=asrt_id, key="confidence", kind="num", value=confidence)]
+            )
+            _set_ingested_at(store, asrt_id, ingested_at)
+            asrt_ids.append(asrt_id)
+
+        resolution = store.resolve_mapping("er:canon_of", policy_mode="edb")
+        self.assertEqual(resolution.chosen_map[(mention,)], ("idref_v1:Person:c_new",))
+        self.assertEqual(resolution.decisions[0].chosen_asrt_id, asrt_ids[2])
+
     def test_mapping_idb_rejects_non_error_tie_break(self) -> None:
         store = Store(
             schema_ir=_schema_with_mapping(
@@ -59,6 +59,20 @@ class PolicyIRV1Tests(unittest.TestCase):
 
         self.assertEqual(policy_digest(policy_a), policy_digest(policy_b))
 
+    def test_reject_float_reports_first_offending_path(self) -> None:
+        policy = build_policy_ir_v1(self.schema_ir)
+        policy["meta"] = {"a": {"k": 1.5, 2: 0}}
+        with self.assertRaisesRegex(
+            PolicyIRValidationError, r"float is not allowed in policy_ir at \$\.meta\.a\.k$"
+        ):
+            policy_digest(policy)
+
+        policy["meta"] = {"a": {2: 0, "k": 1.5}}
+        with self.assertRaisesRegex(
+            PolicyIRValidationError, r"policy_ir object key must be string at \$\.meta\.a$"
+        ):
+            policy_digest(policy)
+
     def test_export_manifest_policy_path_and_digest(self) -> None:
         store = Store(schema_ir=self.schema_ir)
         with tempfile.TemporaryDirectory() as tmp:
@@ -7,6 +7,7 @@ from factpy_kernel.rules.rule_ir import (
     RuleCompileError,
     RuleRegistry,
     RuleSpec,
+    internal_rule_pred_id,
     run_rule,
 )
 from factpy_kernel.store.api import Store
@@ -167,5 +168,16 @@ class RuleRefV1Tests(unittest.TestCase):
             run_rule(self.store, parent, registry)
 
 
+    def test_internal_rule_pred_id_lowercases_per_character(self) -> None:
+        self.assertEqual(
+            internal_rule_pred_id("ΟΔΟΣ", "v1.0"),
+            "__rule_ref__οδοσ__v1_0",
+        )
+        self.assertEqual(
+            internal_rule_pred_id("Q-Parent", "ΑΣ ΣΑ"),
+            "__rule_ref__q_parent__ασ_σα",
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -87,7 +87,7 @@ class SchemaIRV1Tests(unittest.TestCase):
     def test_reject_float_number_in_schema_ir(self) -> None:
         bad = _base_schema_ir()
         bad["entities"][0]["meta"] = {"x": 1.0}
-        with self.assertRaises(SchemaIRValidationError):
+        with self.assertRaisesRegex(SchemaIRValidationError, r"at \$\.entities\[0\]\.meta\.x$"):
             canonicalize_schema_ir_jcs(bad)
 
 
@@ -5,7 +5,7 @@ import unittest
 from factpy_kernel.evidence.write_protocol import retract_by_asrt, set_field
 from factpy_kernel.policy.chosen import PolicyNonDeterminismError, compute_chosen_for_predicate
 from factpy_kernel.store.ledger import Ledger, MetaRow
-from factpy_kernel.view.projector import project_view_facts
+from factpy_kernel.view.projector import cached_project_view_facts, project_view_facts
 
 
 class ViewProjectorV1Tests(unittest.TestCase):
@@ -82,6 +82,44 @@ class ViewProjectorV1Tests(unittest.TestCase):
         view_facts = project_view_facts(self.ledger, self.schema_ir)
         self.assertEqual(view_facts[self.pred_id], [(self.e_ref, "de")])
 
+    def test_cached_view_facts_follow_ledger_version(self) -> None:
+        asrt_1 = set_field(
+            self.ledger,
+            self.pred_id,
+            self.e_ref,
+            [("string", "de")],
+            {"source": "test", "source_loc": "row-1"},
+        )
+        self._set_ingested_at(asrt_1, 100)
+
+        first = cached_project_view_facts(self.ledger, self.schema_ir)
+        first["__extra__"] = []
+        second = cached_project_view_facts(self.ledger, self.schema_ir)
+        self.assertEqual(second, {self.pred_id: [(self.e_ref, "de")]})
+
+        retract_by_asrt(self.ledger, asrt_1, {"source": "review"})
+        third = cached_project_view_facts(self.ledger, self.schema_ir)
+        self.assertEqual(third, {self.pred_id: []})
+
+    def test_cached_view_facts_follow_in_place_schema_edits(self) -> None:
+        for row, (value, ingested_at) in enumerate([("de", 100), ("fr", 200)]):
+            asrt_id = set_field(
+                self.ledger,
+                self.pred_id,
+                self.e_ref,
+                [("string", value)],
+                {"source": "test", "source_loc": f"row-{row}"},
+            )
+            self._set_ingested_at(asrt_id, ingested_at)
+
+        first = cached_project_view_facts(self.ledger, self.schema_ir)
+        self.assertEqual(first[self.pred_id], [(self.e_ref, "fr")])
+
+        self.schema_pred["cardinality"] = "multi"
+        second = cached_project_view_facts(self.ledger, self.schema_ir)
+        self.assertEqual(second, project_view_facts(self.ledger, self.schema_ir))
+        self.assertEqual(second[self.pred_id], [(self.e_ref, "de"), (self.e_ref, "fr")])
+
     def test_missing_ingested_at_raises_policy_error(self) -> None:
         asrt_id = set_field(
             self.ledger,
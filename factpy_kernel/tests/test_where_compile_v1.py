@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import unittest
+
+from factpy_kernel.rules.where_compile import (
+    canonical_where_json_bytes,
+    compile_where_to_query_dl,
+    query_rel_for_where,
+)
+from factpy_kernel.rules.where_eval import WhereValidationError
+
+
+class WhereCompileV1Tests(unittest.TestCase):
+    def test_query_rel_is_sha256_prefix_of_canonical_where(self) -> None:
+        where = [("pred", "person:country", ["$E", "$C"]), ("eq", "$C", "dé")]
+        expected_bytes = json.dumps(
+            where,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode("utf-8")
+
+        self.assertEqual(canonical_where_json_bytes(where), expected_bytes)
+        digest = hashlib.sha256(expected_bytes).hexdigest()
+        self.assertEqual(query_rel_for_where(where), f"query__{digest[:8]}")
+
+    def test_query_rel_follows_where_content_not_identity(self) -> None:
+        where = [("pred", "person:country", ["$E", "$C"]), ("eq", "$C", 1)]
+        first = query_rel_for_where(where)
+
+        where[1] = ("eq", "$C", True)
+        second = query_rel_for_where(where)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(first, query_rel_for_where([("pred", "person:country", ["$E", "$C"]), ("eq", "$C", 1)]))
+
+    def test_compile_sees_predicates_appended_to_schema(self) -> None:
+        schema_ir = {
+            "predicates": [
+                {
+                    "pred_id": "person:country",
+                    "arg_specs": [
+                        {"name": "E", "type_domain": "entity_ref"},
+                        {"name": "country", "type_domain": "string"},
+                    ],
+                }
+            ]
+        }
+        compile_where_to_query_dl(
+            schema_ir=schema_ir,
+            where=[("pred", "person:country", ["$E", "$C"])],
+            query_rel="q",
+        )
+
+        schema_ir["predicates"].append(
+            {
+                "pred_id": "person:age",
+                "arg_specs": [
+                    {"name": "E", "type_domain": "entity_ref"},
+                    {"name": "age", "type_domain": "int"},
+                ],
+                "cardinality": "temporal",
+            }
+        )
+        text = compile_where_to_query_dl(
+            schema_ir=schema_ir,
+            where=[("pred", "person:age", ["$E", "$A"])],
+            query_rel="q",
+            temporal_view="current",
+        )
+        self.assertIn("p_person_age__current(C1, C0)", text)
+
+    def test_compile_sees_in_place_predicate_edits(self) -> None:
+        schema_ir = {
+            "predicates": [
+                {
+                    "pred_id": "p",
+                    "arg_specs": [{"name": "C", "type_domain": "string"}],
+                    "cardinality": "functional",
+                }
+            ]
+        }
+        where = [("pred", "p", ["$C"])]
+        text = compile_where_to_query_dl(
+            schema_ir=schema_ir, where=where, query_rel="q", temporal_view="current"
+        )
+        self.assertIn("p_p(C0)", text)
+
+        schema_ir["predicates"][0]["cardinality"] = "temporal"
+        text = compile_where_to_query_dl(
+            schema_ir=schema_ir, where=where, query_rel="q", temporal_view="current"
+        )
+        self.assertIn("p_p__current(C0)", text)
+
+        schema_ir["predicates"][0]["arg_specs"].append({"name": "D", "type_domain": "int"})
+        with self.assertRaises(WhereValidationError):
+            compile_where_to_query_dl(
+                schema_ir=schema_ir, where=where, query_rel="q", temporal_view="current"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
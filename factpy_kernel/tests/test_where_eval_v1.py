@@ -83,6 +83,54 @@ class WhereEvalV1Tests(unittest.TestCase):
         self.assertEqual(len(bindings), 2)
         self.assertEqual({row["$E"] for row in bindings}, {self.e1, self.e2})
 
+    def test_not_excludes_correlated_matches_per_env(self) -> None:
+        view_facts = project_view_facts(self.store.ledger, self.schema_ir)
+        where = [
+            ("pred", "person:country", ["$E", "$country"]),
+            ("not", [("pred", "person:lang", ["$E", "en"])]),
+        ]
+        bindings = evaluate_where(view_facts, where)
+        self.assertEqual(bindings, [{"$E": self.e2, "$country": "fr"}])
+
+        where_or = [
+            ("pred", "person:country", ["$E", "$country"]),
+            (
+                "not",
+                [
+                    [("pred", "person:lang", ["$E", "$lang"]), ("in", "$lang", ["de"])],
+                    [("pred", "person:country", ["$E", "$other"]), ("eq", "$other", "fr")],
+                ],
+            ),
+        ]
+        bindings = evaluate_where(view_facts, where_or)
+        self.assertEqual(bindings, [{"$E": self.e1, "$country": "de"}])
+
+    def test_reused_where_sees_in_place_mutation(self) -> None:
+        view_facts = project_view_facts(self.store.ledger, self.schema_ir)
+        terms = ["$E", "de"]
+        where = [("pred", "person:country", terms)]
+        self.assertEqual(evaluate_where(view_facts, where), [{"$E": self.e1}])
+
+        terms[1] = "fr"
+        self.assertEqual(evaluate_where(view_facts, where), [{"$E": self.e2}])
+
+        where[0] = ("pred", "person:country", ["$E", "$country"])
+        self.assertEqual(len(evaluate_where(view_facts, where)), 2)
+
+    def test_in_filter_does_not_hide_later_pred_errors(self) -> None:
+        where = [
+            ("pred", "a", ["$x"]),
+            ("pred", "b", ["$y"]),
+            ("in", "$x", ["zzz"]),
+        ]
+        with self.assertRaisesRegex(WhereValidationError, "unknown predicate in where: b"):
+            evaluate_where({"a": [("x1",), ("x2",)]}, where)
+        with self.assertRaisesRegex(WhereValidationError, "arity mismatch for predicate b"):
+            evaluate_where({"a": [("x1",), ("x2",)], "b": [("y", "extra")]}, where)
+        self.assertEqual(
+            evaluate_where({"a": [("x1",), ("x2",)], "b": [("y",)]}, where), []
+        )
+
     def test_invalid_where_dsl_raises(self) -> None:
         view_facts = project_view_facts(self.store.ledger, self.schema_ir)
 
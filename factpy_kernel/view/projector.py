@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import weakref
 from typing import Any
 
-from factpy_kernel.policy.active import is_active
 from factpy_kernel.policy.chosen import (
     PolicyNonDeterminismError,
     choose_one,
     compute_chosen_for_predicate,
     group_key_for_claim,
 )
+from factpy_kernel.schema.schema_ir import schema_predicates_fingerprint
 from factpy_kernel.store.ledger import Claim, Ledger
 
 
@@ -16,17 +17,33 @@ class ViewProjectionError(Exception):
     pass
 
 
+_VIEW_FACTS_CACHE: weakref.WeakKeyDictionary[
+    Ledger, dict[tuple[int, str], tuple[int, dict, str, dict[str, list[tuple[Any, ...]]]]]
+] = weakref.WeakKeyDictionary()
+
+
 def build_args_for_claim(ledger: Ledger, claim: Claim) -> tuple[Any, ...]:
     if not isinstance(ledger, Ledger):
         raise TypeError("ledger must be Ledger")
     if not isinstance(claim, Claim):
         raise TypeError("claim must be Claim")
+    return _args_for_claim(ledger, claim)
+
+
+def build_args_for_claims(ledger: Ledger, claims: list[Claim]) -> list[tuple[Any, ...]]:
+    if not isinstance(ledger, Ledger):
+        raise TypeError("ledger must be Ledger")
+    for claim in claims:
+        if not isinstance(claim, Claim):
+            raise TypeError("claim must be Claim")
+    return [_args_for_claim(ledger, claim) for claim in claims]
+
 
-    rows = [row for row in ledger.claim_args if row.asrt_id == claim.asrt_id]
-    if not rows:
+def _args_for_claim(ledger: Ledger, claim: Claim) -> tuple[Any, ...]:
+    sorted_rows = ledger.claim_args_for(claim.asrt_id)
+    if not sorted_rows:
         raise ViewProjectionError(f"missing claim_arg rows for asrt_id={claim.asrt_id}")
 
-    sorted_rows = sorted(rows, key=lambda row: row.idx)
     if len(sorted_rows) != len(claim.rest_terms):
         raise ViewProjectionError(
             f"claim_arg count mismatch for asrt_id={claim.asrt_id}"
@@ -59,6 +76,7 @@ def project_view_facts(
         raise ViewProjectionError("schema_ir.predicates must be list")
 
     output: dict[str, list[tuple[Any, ...]]] = {}
+    active_asrt_ids = ledger.active_asrt_id_set()
 
     for schema_pred in predicates:
         if not isinstance(schema_pred, dict):
@@ -71,7 +89,7 @@ def project_view_facts(
         active_claims = [
             claim
             for claim in ledger.find_claims(pred_id=pred_id)
-            if is_active(ledger, claim.asrt_id)
+            if claim.asrt_id in active_asrt_ids
         ]
 
         selected_claims: list[Claim]
@@ -92,8 +110,14 @@ def project_view_facts(
             else:
                 try:
                     groups: dict[tuple[Any, ...], list[Claim]] = {}
+                    indexes_by_arg_count: dict[int, tuple[int, ...]] = {}
                     for claim in active_claims:
-                        group_key = group_key_for_claim(schema_pred, claim, ledger=ledger)
+                        group_key = group_key_for_claim(
+                            schema_pred,
+                            claim,
+                            ledger=ledger,
+                            indexes_by_arg_count=indexes_by_arg_count,
+                        )
                         groups.setdefault(group_key, []).append(claim)
                     selected_claims = []
                     for claims in groups.values():
@@ -107,7 +131,38 @@ def project_view_facts(
         else:
             raise ViewProjectionError(f"unsupported cardinality: {cardinality}")
 
-        facts = [build_args_for_claim(ledger, claim) for claim in selected_claims]
+        facts = build_args_for_claims(ledger, selected_claims)
         output[pred_id] = sorted(facts, key=lambda fact: tuple(str(part) for part in fact))
 
     return output
+
+
+def cached_project_view_facts(
+    ledger: Ledger,
+    schema_ir: dict,
+    *,
+    temporal_view: str = "record",
+) -> dict[str, list[tuple[Any, ...]]]:
+    if not isinstance(ledger, Ledger):
+        raise TypeError("ledger must be Ledger")
+    if not isinstance(schema_ir, dict):
+        raise ViewProjectionError("schema_ir must be dict")
+
+    # Entries are invalidated by Ledger.version; schema_ir is matched by identity
+    # and by its predicates' contents, so in-place schema edits are picked up.
+    # Callers get a fresh top-level dict but share the fact lists.
+    entries = _VIEW_FACTS_CACHE.setdefault(ledger, {})
+    cache_key = (id(schema_ir), temporal_view)
+    fingerprint = schema_predicates_fingerprint(schema_ir)
+    cached = entries.get(cache_key)
+    if (
+        cached is not None
+        and cached[0] == ledger.version
+        and cached[1] is schema_ir
+        and cached[2] == fingerprint
+    ):
+        return dict(cached[3])
+
+    output = project_view_facts(ledger, schema_ir, temporal_view=temporal_view)
+    entries[cache_key] = (ledger.version, schema_ir, fingerprint, output)
+    return dict(output)